@@ -615,6 +615,10 @@ class ThemeEditorMainWindow(QMainWindow):
         else:
             event.accept()
 
+        # A theme file still loading on its worker thread must finish before the editor goes away
+        if event.isAccepted() and hasattr(self, 'qt_widget_editor_tab'):
+            self.qt_widget_editor_tab._stop_loader()
+
 
 class SettingsDialog(QDialog):
     """Settings dialog for application theme selection"""
@@ -3,20 +3,29 @@ Qt Widget Theme Editor
 Editor for Qt Widget themes with comprehensive widget selector and live preview
 """
 
+import bisect
+import functools
 import re
+import sys
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
-    QListWidget, QTextEdit, QSplitter, QGroupBox, QLineEdit, QMessageBox,
+    QListWidget, QListView, QTextEdit, QPlainTextEdit, QSplitter, QGroupBox, QLineEdit, QMessageBox,
     QInputDialog, QScrollArea, QSpinBox, QRadioButton, QCheckBox,
     QProgressBar, QSlider, QDateEdit, QTimeEdit, QDateTimeEdit, QDoubleSpinBox,
-    QTabWidget, QFrame, QGridLayout, QSizePolicy
+    QTabWidget, QFrame, QGridLayout, QFormLayout, QSizePolicy, QCompleter, QStackedLayout, QFileDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QThread, QTimer, QSignalBlocker, QStringListModel, QSortFilterProxyModel, QModelIndex,
+    QDate, QTime, QDateTime
+)
+from PyQt6.QtGui import QTextCursor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
+from .color_picker import ColorPickerButton
+from .preview_widgets import QtWidgetPreviewPanel
 from .theme_data import QtWidgetTheme
-from .theme_manager import ThemeManager
+from .theme_manager import ThemeManager, decode_json
 from .widget_indexer import build_entries_by_qt_class, location_display_name
 
 # ── Claude_DB → Qt Widget Theme format converter ─────────────────────────────
@@ -97,10 +106,65 @@ def _convert_claude_db_theme(widgets: dict) -> dict[str, str]:
 
             result.setdefault(full_sel, {})[css_prop] = css_val
 
-    return {sel: "; ".join(f"{p}: {v}" for p, v in decls.items())
+    return {sel: "; ".join(map(": ".join, decls.items()))
             for sel, decls in result.items()}
 
 
+def _read_qt_theme_file(theme_manager: ThemeManager, filename: str) -> tuple[dict, bool]:
+    """Read a Qt widget theme file, converting Claude_DB files on the fly.
+
+    Returns (themes, converted). Runs on the loader thread - no Qt calls here.
+    """
+    raw = decode_json(Path(filename).read_bytes())
+
+    # ── Detect and convert Claude_DB format ──────────────────────────
+    converted = _is_claude_db_format(raw)
+    if converted:
+        # Claude_DB file: { "ThemeName": { "globals": {...}, "widgets": {...} } }
+        loaded_themes = {}
+        for theme_name, theme_body in raw.items():
+            if not isinstance(theme_body, dict):
+                continue
+            widgets_section = theme_body.get("widgets", theme_body)
+            css_map = _convert_claude_db_theme(widgets_section)
+            if not css_map:
+                continue
+            # Build QtWidgetTheme objects from the converted CSS map
+            qt_theme = QtWidgetTheme(name=theme_name)
+            for selector, css in css_map.items():
+                qt_theme.add_widget_style(selector, css)
+            loaded_themes[theme_name] = qt_theme
+    else:
+        # ── Standard Theme_Editor format ─────────────────────────────
+        loaded_themes = theme_manager.load_qt_widget_themes(filename)
+
+    # Intern selector keys so later lookups/comparisons hit on identity
+    for qt_theme in loaded_themes.values():
+        qt_theme.styles = {sys.intern(sel): css for sel, css in qt_theme.styles.items()}
+
+    return loaded_themes, converted
+
+
+class _ThemeFileLoader(QThread):
+    """Reads and parses a theme file off the GUI thread."""
+
+    loaded = pyqtSignal(str, dict, bool)   # filename, themes, converted
+    failed = pyqtSignal(str, str)          # filename, error message
+
+    def __init__(self, theme_manager: ThemeManager, filename: str, parent=None):
+        super().__init__(parent)
+        self._theme_manager = theme_manager
+        self._filename = filename
+
+    def run(self):
+        try:
+            themes, converted = _read_qt_theme_file(self._theme_manager, self._filename)
+        except Exception as e:
+            self.failed.emit(self._filename, str(e))
+            return
+        self.loaded.emit(self._filename, themes, converted)
+
+
 # ── UI colour constants (dark theme defaults) ─────────────────────────────────
 _C_ACCENT       = "#0078D4"
 _C_ACCENT2      = "#1E90FF"
@@ -141,7 +205,7 @@ WIDGET_BUTTONS: list[tuple[str, str, str, str]] = [
 
 
 # Comprehensive list of Qt widgets and selectors
-QT_WIDGET_SELECTORS = [
+QT_WIDGET_SELECTORS = (
     # Main containers
     "QMainWindow",
     "QWidget",
@@ -298,7 +362,60 @@ QT_WIDGET_SELECTORS = [
     "QDial",
     "QToolBox",
     "QToolBox::tab",
-]
+)
+# Selectors are dict keys and set members throughout the editor — intern the
+# canonical ones so equality checks short-circuit on identity
+QT_WIDGET_SELECTORS = tuple(sys.intern(s) for s in QT_WIDGET_SELECTORS)
+QT_WIDGET_SELECTORS_SET = frozenset(QT_WIDGET_SELECTORS)
+
+# Sorted copy for the add-widget completions — computed once at import
+QT_WIDGET_SELECTORS_SORTED = tuple(sorted(QT_WIDGET_SELECTORS))
+
+
+# Default style templates for common widgets, used when adding a selector
+_DEFAULT_STYLES: Dict[str, str] = {
+    "QPushButton": "background-color: #0078D4; color: #FFFFFF; border: 1px solid #555; border-radius: 4px; padding: 6px 12px;",
+    "QLineEdit": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; border-radius: 3px; padding: 4px;",
+    "QTextEdit": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555;",
+    "QComboBox": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; border-radius: 3px; padding: 4px;",
+    "QCheckBox": "color: #FFFFFF; spacing: 5px;",
+    "QCheckBox::indicator": "width: 18px; height: 18px; border: 2px solid #555; border-radius: 3px; background-color: #3C3C3C;",
+    "QCheckBox::indicator:checked": "background-color: #0078D4; border-color: #0078D4;",
+    "QRadioButton": "color: #FFFFFF; spacing: 5px;",
+    "QRadioButton::indicator": "width: 18px; height: 18px; border: 2px solid #555; border-radius: 9px; background-color: #3C3C3C;",
+    "QRadioButton::indicator:checked": "background-color: #0078D4; border-color: #0078D4;",
+    "QLabel": "color: #FFFFFF; background-color: transparent;",
+    "QGroupBox": "color: #FFFFFF; border: 1px solid #555; border-radius: 4px; margin-top: 10px; padding-top: 10px;",
+    "QProgressBar": "border: 1px solid #555; border-radius: 3px; background-color: #3C3C3C; text-align: center;",
+    "QProgressBar::chunk": "background-color: #0078D4; border-radius: 2px;",
+    "QSlider::groove:horizontal": "border: 1px solid #555; height: 6px; background: #3C3C3C; border-radius: 3px;",
+    "QSlider::handle:horizontal": "background: #0078D4; border: 1px solid #555; width: 16px; margin: -5px 0; border-radius: 8px;",
+    "QSpinBox": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; border-radius: 3px; padding: 4px;",
+    "QDateEdit": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; border-radius: 3px; padding: 4px;",
+    "QTimeEdit": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; border-radius: 3px; padding: 4px;",
+    "QListWidget": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555;",
+    "QListWidget::item": "padding: 4px;",
+    "QListWidget::item:selected": "background-color: #0078D4; color: #FFFFFF;",
+    "QTableWidget": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; gridline-color: #555;",
+    "QTreeWidget": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555;",
+    "QScrollBar:vertical": "background: #2B2B2B; width: 12px; border: none;",
+    "QScrollBar::handle:vertical": "background: #555555; border-radius: 6px; min-height: 20px;",
+    "QTabWidget::pane": "border: 1px solid #555; background-color: #2B2B2B;",
+    "QTabBar::tab": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; padding: 6px 12px;",
+    "QTabBar::tab:selected": "background-color: #0078D4; color: #FFFFFF;",
+    "QMenuBar": "background-color: #2B2B2B; color: #FFFFFF;",
+    "QMenuBar::item": "padding: 4px 8px;",
+    "QMenuBar::item:selected": "background-color: #0078D4;",
+    "QMenu": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555;",
+    "QMenu::item": "padding: 4px 20px;",
+    "QMenu::item:selected": "background-color: #0078D4;",
+}
+_GENERIC_DEFAULT_STYLE = "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555;"
+
+
+def _utf16_len(text: str) -> int:
+    """Length of text in UTF-16 code units (the unit of QTextCursor positions)"""
+    return len(text.encode('utf-16-le')) // 2
 
 
 # ── WidgetSelectorPanel ───────────────────────────────────────────────────────
@@ -568,23 +685,374 @@ class UsagePanel(QWidget):
         )
 
 
+# ── Single-widget preview factories ──────────────────────────────────────────
+
+def _preview_button():
+    return QPushButton("Sample Button")
+
+
+def _preview_line_edit():
+    edit = QLineEdit()
+    edit.setPlaceholderText("Sample text...")
+    return edit
+
+
+def _preview_combo():
+    combo = QComboBox()
+    combo.addItems(["Option 1", "Option 2", "Option 3"])
+    return combo
+
+
+def _preview_progress():
+    progress = QProgressBar()
+    progress.setValue(65)
+    return progress
+
+
+def _preview_slider():
+    slider = QSlider(Qt.Orientation.Horizontal)
+    slider.setValue(50)
+    return slider
+
+
+def _preview_spinbox():
+    spinbox = QSpinBox()
+    spinbox.setValue(50)
+    return spinbox
+
+
+def _preview_double_spinbox():
+    spinbox = QDoubleSpinBox()
+    spinbox.setValue(3.14)
+    return spinbox
+
+
+def _preview_date_edit():
+    date_edit = QDateEdit()
+    date_edit.setDate(QDate.currentDate())
+    date_edit.setCalendarPopup(True)
+    return date_edit
+
+
+def _preview_time_edit():
+    time_edit = QTimeEdit()
+    time_edit.setTime(QTime.currentTime())
+    return time_edit
+
+
+def _preview_datetime_edit():
+    datetime_edit = QDateTimeEdit()
+    datetime_edit.setDateTime(QDateTime.currentDateTime())
+    return datetime_edit
+
+
+def _preview_text_edit():
+    edit = QTextEdit()
+    edit.setPlaceholderText("Sample text...")
+    edit.setMaximumHeight(60)
+    return edit
+
+
+def _preview_list_widget():
+    list_widget = QListWidget()
+    list_widget.addItems(["Item 1", "Item 2", "Item 3"])
+    list_widget.setMaximumHeight(80)
+    return list_widget
+
+
+def _preview_group_box():
+    group = QGroupBox("Sample Group")
+    layout = QVBoxLayout(group)
+    layout.addWidget(QLabel("Content"))
+    return group
+
+
+def _preview_tab_widget():
+    tabs = QTabWidget()
+    tabs.addTab(QLabel("Tab 1 Content"), "Tab 1")
+    tabs.addTab(QLabel("Tab 2 Content"), "Tab 2")
+    tabs.setMaximumHeight(100)
+    return tabs
+
+
+# Base selector -> factory for the single-widget preview in the style editor
+_PREVIEW_FACTORIES: dict[str, Callable[[], QWidget]] = {
+    "QPushButton": _preview_button,
+    "QLineEdit": _preview_line_edit,
+    "QLabel": lambda: QLabel("Sample Label"),
+    "QComboBox": _preview_combo,
+    "QCheckBox": lambda: QCheckBox("Sample Checkbox"),
+    "QRadioButton": lambda: QRadioButton("Sample Radio"),
+    "QProgressBar": _preview_progress,
+    "QSlider": _preview_slider,
+    "QSpinBox": _preview_spinbox,
+    "QDoubleSpinBox": _preview_double_spinbox,
+    "QDateEdit": _preview_date_edit,
+    "QTimeEdit": _preview_time_edit,
+    "QDateTimeEdit": _preview_datetime_edit,
+    "QTextEdit": _preview_text_edit,
+    "QListWidget": _preview_list_widget,
+    "QGroupBox": _preview_group_box,
+    "QTabWidget": _preview_tab_widget,
+}
+
+
+# ── Visual property rows ──────────────────────────────────────────────────────
+
+# #RRGGBB or #RRGGBBAA inside a CSS value
+_HEX_COLOR_RE = re.compile(r'#[0-9A-Fa-f]{6}(?:[0-9A-Fa-f]{2})?')
+
+# Named colors the picker understands, mapped to hex
+_NAMED_COLORS: Dict[str, str] = {
+    'transparent': '#000000',  # Show as black in picker, but we know it's transparent
+    'none': '#000000',
+    'black': '#000000',
+    'white': '#FFFFFF',
+    'red': '#FF0000',
+    'green': '#00FF00',
+    'blue': '#0000FF',
+    'yellow': '#FFFF00',
+    'cyan': '#00FFFF',
+    'magenta': '#FF00FF',
+    'gray': '#808080',
+    'grey': '#808080',
+    'darkgray': '#A9A9A9',
+    'darkgrey': '#A9A9A9',
+    'lightgray': '#D3D3D3',
+    'lightgrey': '#D3D3D3',
+}
+# Scanned in order for substring matches ("1px solid transparent")
+_NAMED_COLOR_ITEMS = tuple(_NAMED_COLORS.items())
+
+# Row editor choice in _update_visual_properties
+_COLOR_PROP_WORDS = ('color', 'background', 'border')
+_PICKER_NAMED_COLORS = frozenset((
+    'transparent', 'none', 'black', 'white', 'red', 'green', 'blue',
+    'yellow', 'cyan', 'magenta', 'gray', 'grey',
+))
+_DIMENSION_PROPS = frozenset(('padding', 'margin', 'border-width'))
+# A single integer length, "4" or "4px" — group 2 tells whether the unit was given
+_PX_INT_RE = re.compile(r'\s*(\d+)\s*(px)?\s*')
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_declarations(style: str) -> tuple[tuple[str, str], ...]:
+    """(property, value) pairs of a style string, memoized — switching back and
+    forth between selectors re-shows the same styles. Immutable, so safe to share."""
+    return tuple(QtWidgetTheme.parse_style(style).items())
+
+
+class _PropRow:
+    """One reusable row of the visual property form.
+    Holds every editor kind; only the one matching the property is shown."""
+
+    def __init__(self, editor: "QtWidgetThemeEditor"):
+        self.prop_name = ""
+        self.label = QLabel()
+        self.field = QWidget()
+        field_layout = QHBoxLayout(self.field)
+        field_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.color_picker = ColorPickerButton("#000000")
+        self.spinbox = QSpinBox()
+        self.spinbox.setSuffix(" px")
+        self.line_edit = QLineEdit()
+        self._editors = (self.color_picker, self.spinbox, self.line_edit)
+        for widget in self._editors:
+            field_layout.addWidget(widget)
+
+        # Connected once to bound methods — prop_name is read at emit time, so
+        # reusing the row for another property needs no reconnect or closure
+        self._editor = editor
+        self.color_picker.colorChanged.connect(self._color_changed)
+        self.spinbox.valueChanged.connect(self._value_changed)
+        self.line_edit.textChanged.connect(self._text_changed)
+
+    def _color_changed(self, color: str):
+        self._editor._on_color_changed(self.prop_name, color)
+
+    def _value_changed(self, value: int):
+        self._editor._on_dimension_changed(self.prop_name, value)
+
+    def _text_changed(self, text: str):
+        self._editor._on_text_property_changed(self.prop_name, text)
+
+    def _bind(self, prop_name: str, shown: QWidget):
+        """Point the row at prop_name and show only the given editor"""
+        self.prop_name = prop_name
+        self.label.setText(f"{prop_name}:")
+        for widget in self._editors:
+            widget.setVisible(widget is shown)
+
+    def show_color(self, prop_name: str, color: str):
+        self._bind(prop_name, self.color_picker)
+        with QSignalBlocker(self.color_picker):
+            self.color_picker.set_color(color)
+
+    def show_spin(self, prop_name: str, value: int, maximum: int):
+        self._bind(prop_name, self.spinbox)
+        with QSignalBlocker(self.spinbox):
+            self.spinbox.setRange(0, maximum)
+            self.spinbox.setValue(value)
+
+    def show_text(self, prop_name: str, text: str):
+        self._bind(prop_name, self.line_edit)
+        with QSignalBlocker(self.line_edit):
+            self.line_edit.setText(text)
+
+
+# ── Add-widget completions ────────────────────────────────────────────────────
+
+class _AvailableSelectorsModel(QSortFilterProxyModel):
+    """Per-editor view of the shared selector model that hides the selectors
+    the current theme already styles."""
+
+    def __init__(self, source: QStringListModel, parent=None):
+        super().__init__(parent)
+        self._existing: frozenset[str] = frozenset()
+        self.setSourceModel(source)
+
+    def set_existing(self, existing: frozenset[str]):
+        if existing != self._existing:
+            self._existing = existing
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        # The source rows are exactly QT_WIDGET_SELECTORS_SORTED
+        return QT_WIDGET_SELECTORS_SORTED[source_row] not in self._existing
+
+
 # ── QtWidgetThemeEditor ───────────────────────────────────────────────────────
 
+# Editor chrome, installed once on the editor and matched by object name.
+# Everything is scoped to named widgets so nothing leaks into the live preview.
+# widget_preview_container also styles its descendants, as its old selector-less
+# stylesheet did; the single-widget preview's own rule still wins over it.
+_EDITOR_CHROME_QSS = """
+    QLabel#file_status {
+        color: #FF9800; font-weight: bold; padding: 5px;
+        background-color: #3C3C3C; border-radius: 3px;
+    }
+    QLabel#file_status[fileLoaded="true"] {
+        color: #4CAF50;
+    }
+    QLabel#current_widget_label {
+        font-weight: bold; font-size: 11pt;
+    }
+    QLabel#live_preview_title {
+        font-size: 14pt; font-weight: bold; padding: 5px;
+    }
+    #widget_preview_container, #widget_preview_container QWidget {
+        background-color: #2B2B2B; border: 1px solid #555; border-radius: 3px;
+    }
+    QScrollArea#props_scroll {
+        background-color: transparent;
+    }
+    QWidget#props_content {
+        background-color: #2B2B2B;
+    }
+    QScrollArea#props_scroll QScrollBar:vertical {
+        border: none;
+        background: #1E1E1E;
+        width: 10px;
+        margin: 0;
+    }
+    QScrollArea#props_scroll QScrollBar::handle:vertical {
+        background: #555555;
+        min-height: 30px;
+        border-radius: 5px;
+    }
+    QScrollArea#props_scroll QScrollBar::handle:vertical:hover {
+        background: #777777;
+    }
+    QScrollArea#props_scroll QScrollBar::add-line:vertical,
+    QScrollArea#props_scroll QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
+
+
 class QtWidgetThemeEditor(QWidget):
     """Qt Widget Theme Editor with live preview"""
 
     themeModified = pyqtSignal()   # Emitted when theme is modified
     navigate_to   = pyqtSignal(str)  # class name to navigate to (forwarded from UsagePanel)
 
+    # All canonical selectors, built once and shared by every editor instance
+    _shared_selectors_model: Optional[QStringListModel] = None
+
+    @classmethod
+    def _shared_selectors(cls) -> QStringListModel:
+        if QtWidgetThemeEditor._shared_selectors_model is None:
+            QtWidgetThemeEditor._shared_selectors_model = QStringListModel(list(QT_WIDGET_SELECTORS_SORTED))
+        return QtWidgetThemeEditor._shared_selectors_model
+
     def __init__(self, theme_manager: ThemeManager, parent=None):
         super().__init__(parent)
         self.theme_manager = theme_manager
+        # File dialog defaults — the themes directory never changes per manager
+        self._default_load_dir = str(theme_manager.qt_widget_themes_dir)
+        self._default_save_path = str(theme_manager.qt_widget_themes_dir / "qt_themes.json")
         self.themes: Dict[str, QtWidgetTheme] = {}
         self.current_theme_name: Optional[str] = None
         self.current_theme: Optional[QtWidgetTheme] = None
         self.current_file_path: Optional[str] = None  # Track which file is currently loaded
         self.unsaved_changes = False
 
+        # Last stylesheet pushed to the preview panel (skip identical re-applies)
+        self._last_applied_css: Optional[str] = None
+        self._last_applied_hash: Optional[int] = None
+        # id(theme) -> (theme, styles_version, generated stylesheet)
+        self._qss_cache: Dict[int, tuple[QtWidgetTheme, int, str]] = {}
+
+        # selector -> row in the hidden widget list (replaces findItems scans)
+        self._widget_row_index: Dict[str, int] = {}
+
+        # Background theme-file loader (None when idle)
+        self._loader: Optional[_ThemeFileLoader] = None
+
+        # Raw CSS edits are applied once typing pauses, not per keystroke
+        self._pending_raw_selector: Optional[str] = None
+        self._css_debounce = QTimer(self)
+        self._css_debounce.setSingleShot(True)
+        self._css_debounce.setInterval(150)
+        self._css_debounce.timeout.connect(self._apply_raw_style_now)
+
+        # Typed property values are likewise collected and applied in one rebuild
+        self._pending_updates: Dict[str, str] = {}
+        self._pending_updates_selector: Optional[str] = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(100)
+        self._update_timer.timeout.connect(self._flush_css_update)
+        # Per-keystroke handler specialised for the selector being edited;
+        # rebound whenever the editor is pointed elsewhere, None when idle
+        self._queue_text_property: Optional[Callable[[str, str], None]] = None
+
+        # Coalesces themeModified so a burst of edits notifies listeners once
+        self._modified_timer = QTimer(self)
+        self._modified_timer.setSingleShot(True)
+        self._modified_timer.setInterval(0)
+        self._modified_timer.timeout.connect(self.themeModified.emit)
+
+        # Full preview panel restyle after edits, coalesced over a short pause
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(120)
+        self._apply_timer.timeout.connect(self._apply_preview)
+
+        # Single-widget preview for property edits, rendered on the next event-loop
+        # tick so the editor repaints first; bursts collapse into one render
+        self._pending_preview: Optional[tuple[str, str]] = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(0)
+        self._preview_timer.timeout.connect(self._flush_preview)
+
+        # Style whose property rows were skipped while the editor was off screen
+        self._cached_style = ""
+        self._dirty_for_selection = False
+
         self._setup_ui()
         # DON'T load default file on startup - user must choose a file first!
 
@@ -594,10 +1062,13 @@ class QtWidgetThemeEditor(QWidget):
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
 
+        # One polish pass for all editor chrome instead of a stylesheet per widget
+        self.setStyleSheet(_EDITOR_CHROME_QSS)
+
         # File status bar - show which file is currently loaded
         file_status_layout = QHBoxLayout()
         self.file_status_label = QLabel("No file loaded - click 'Load from File...' or 'New File' to start")
-        self.file_status_label.setStyleSheet("color: #FF9800; font-weight: bold; padding: 5px; background-color: #3C3C3C; border-radius: 3px;")
+        self.file_status_label.setObjectName("file_status")
         file_status_layout.addWidget(self.file_status_label)
         layout.addLayout(file_status_layout)
 
@@ -606,7 +1077,11 @@ class QtWidgetThemeEditor(QWidget):
 
         # Theme selector
         controls_layout.addWidget(QLabel("Theme:"))
+        # Sorted theme names, shared with the combo through a string-list model
+        self._theme_names: list[str] = []
+        self._theme_model = QStringListModel(self)
         self.theme_combo = QComboBox()
+        self.theme_combo.setModel(self._theme_model)
         self.theme_combo.currentTextChanged.connect(self._on_theme_changed)
         controls_layout.addWidget(self.theme_combo, 1)
 
@@ -656,16 +1131,25 @@ class QtWidgetThemeEditor(QWidget):
         editor_layout = QVBoxLayout(editor_widget)
         editor_layout.setContentsMargins(0, 0, 0, 0)
 
-        # Hidden widget list — kept for internal state tracking by existing methods
-        self.widget_list = QListWidget()
-        self.widget_list.currentTextChanged.connect(self._on_widget_selected)
+        # Hidden widget list — kept for internal state tracking by existing methods.
+        # A plain string model avoids allocating one QListWidgetItem per selector.
+        self._selectors_model = QStringListModel(self)
+        self.widget_list = QListView()
+        self.widget_list.setUniformItemSizes(True)
+        self.widget_list.setModel(self._selectors_model)
+        self.widget_list.selectionModel().currentChanged.connect(self._on_widget_index_changed)
         self.widget_list.hide()
 
-        # Hidden add-widget combo — still used by _add_widget / _remove_widget
-        self.widget_selector_combo = QComboBox()
-        self.widget_selector_combo.setEditable(True)
-        self.widget_selector_combo.addItems(sorted(QT_WIDGET_SELECTORS))
-        self.widget_selector_combo.hide()
+        # Hidden add-widget input — still used by _add_widget / _remove_widget.
+        # Completion runs against a string model; no per-selector combo items.
+        self._available_model = _AvailableSelectorsModel(self._shared_selectors(), self)
+        selector_completer = QCompleter(self._available_model, self)
+        selector_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        selector_completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self.widget_selector_edit = QLineEdit()
+        self.widget_selector_edit.setPlaceholderText("Widget selector (e.g. QPushButton:hover)")
+        self.widget_selector_edit.setCompleter(selector_completer)
+        self.widget_selector_edit.hide()
 
         self.remove_widget_btn = QPushButton("Remove Selected Widget")
         self.remove_widget_btn.clicked.connect(self._remove_widget)
@@ -675,13 +1159,19 @@ class QtWidgetThemeEditor(QWidget):
         self.add_widget_btn.clicked.connect(self._add_widget)
         self.add_widget_btn.hide()
 
+        # Reusable "already exists" notice — built once instead of per Add click
+        self._dup_widget_box = QMessageBox(
+            QMessageBox.Icon.Information, "Widget Exists", "",
+            QMessageBox.StandardButton.Ok, self
+        )
+
         # Style editor group — takes the full middle pane
         style_group = QGroupBox("Widget Style Editor")
         style_layout = QVBoxLayout(style_group)
 
         # Current widget label
         self.current_widget_label = QLabel("Select a widget to edit")
-        self.current_widget_label.setStyleSheet("font-weight: bold; font-size: 11pt;")
+        self.current_widget_label.setObjectName("current_widget_label")
         style_layout.addWidget(self.current_widget_label)
 
         # Widget preview (show the actual widget being edited)
@@ -690,11 +1180,16 @@ class QtWidgetThemeEditor(QWidget):
 
         self.widget_preview_container = QWidget()
         self.widget_preview_container.setMinimumHeight(80)
-        self.widget_preview_container.setStyleSheet("background-color: #2B2B2B; border: 1px solid #555; border-radius: 3px;")
-        preview_layout = QVBoxLayout(self.widget_preview_container)
-        preview_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.widget_preview_container.setObjectName("widget_preview_container")
+        # One persistent preview widget per base selector, swapped in a stack
+        self._preview_stack = QStackedLayout(self.widget_preview_container)
+        self._preview_cache: Dict[str, QWidget] = {}
+        self._preview_qss: Dict[str, str] = {}       # base selector -> stylesheet it shows
+        self._last_preview_key: Optional[tuple] = None
+        self._preview_dirty: Optional[tuple] = None   # preview skipped while hidden
         self.widget_preview = QLabel("No widget selected")
-        preview_layout.addWidget(self.widget_preview)
+        self.widget_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._preview_stack.addWidget(self.widget_preview)
         style_layout.addWidget(self.widget_preview_container)
 
         # Visual style properties (scrollable with better layout)
@@ -703,44 +1198,30 @@ class QtWidgetThemeEditor(QWidget):
         props_scroll.setMinimumHeight(150)
         props_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         props_scroll.setFrameShape(QScrollArea.Shape.NoFrame)
+        props_scroll.setObjectName("props_scroll")
 
         props_widget = QWidget()
         props_widget.setObjectName("props_content")
         self.props_layout = QVBoxLayout(props_widget)
         self.props_layout.setContentsMargins(5, 5, 5, 5)
         self.props_layout.setSpacing(0)
+
+        # One form for all property rows; rows are pooled and reused per selection
+        self._props_form = QFormLayout()
+        self._props_form.setSpacing(8)
+        self._props_form.setHorizontalSpacing(12)
+        self._props_form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+        self._props_form.setLabelAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self._props_form.setFormAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.props_layout.addLayout(self._props_form)
         self.props_layout.addStretch()
+        self._row_pool: list[_PropRow] = []
 
         props_scroll.setWidget(props_widget)
-
-        # Style the scroll area for dark theme
-        props_scroll.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-            }
-            QWidget#props_content {
-                background-color: #2B2B2B;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #1E1E1E;
-                width: 10px;
-                margin: 0;
-            }
-            QScrollBar::handle:vertical {
-                background: #555555;
-                min-height: 30px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #777777;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        self._props_widget = props_widget
 
         style_layout.addWidget(props_scroll, 1)
+        self._props_scroll = props_scroll
 
         # Raw CSS editor (collapsible)
         self.show_css_btn = QPushButton("▼ Show Raw CSS")
@@ -748,7 +1229,7 @@ class QtWidgetThemeEditor(QWidget):
         self.show_css_btn.clicked.connect(self._toggle_css_editor)
         style_layout.addWidget(self.show_css_btn)
 
-        self.style_edit = QTextEdit()
+        self.style_edit = QPlainTextEdit()
         self.style_edit.setPlaceholderText("CSS-like style properties (e.g., background-color: #282828; color: #EBDBB2;)")
         self.style_edit.setMaximumHeight(100)
         self.style_edit.textChanged.connect(self._on_raw_style_changed)
@@ -798,15 +1279,13 @@ class QtWidgetThemeEditor(QWidget):
 
     def _create_full_preview_panel(self) -> QWidget:
         """Create the live preview widget with all Qt widgets"""
-        from .preview_widgets import QtWidgetPreviewPanel
-
         preview_container = QWidget()
         preview_layout = QVBoxLayout(preview_container)
         preview_layout.setContentsMargins(0, 0, 0, 0)
 
         # Preview label
         preview_label = QLabel("Live Preview")
-        preview_label.setStyleSheet("font-size: 14pt; font-weight: bold; padding: 5px;")
+        preview_label.setObjectName("live_preview_title")
         preview_layout.addWidget(preview_label)
 
         # Scroll area for preview
@@ -823,47 +1302,122 @@ class QtWidgetThemeEditor(QWidget):
 
         return preview_container
 
+    @pyqtSlot(str)
     def _on_theme_changed(self, theme_name: str):
         """Handle theme selection change"""
+        self._flush_pending_edits()
         if not theme_name or theme_name not in self.themes:
             return
 
+        # Re-selecting the current theme (e.g. the combo being repopulated) needs
+        # no rebuild. Compare the object too: a reloaded file reuses the names.
+        theme = self.themes[theme_name]
+        if theme_name == self.current_theme_name and theme is self.current_theme:
+            return
+
         self.current_theme_name = theme_name
-        self.current_theme = self.themes[theme_name]
+        self.current_theme = theme
 
-        # Update widget list
-        self.widget_list.clear()
-        self.widget_list.addItems(self.current_theme.get_widget_selectors())
+        # Update widget list — only the selectors that differ between themes
+        self._sync_widget_rows(self.current_theme.get_widget_selectors())
 
-        # Update add widget dropdown to exclude already-added widgets
+        # Update add widget completions to exclude already-added widgets
         self._update_available_widgets()
 
         # Clear style editor
-        self.style_edit.blockSignals(True)
-        self.style_edit.clear()
-        self.style_edit.blockSignals(False)
+        with QSignalBlocker(self.style_edit):
+            self.style_edit.clear()
         self.current_widget_label.setText("Select a widget to edit")
 
         # Apply to preview
         self._apply_preview()
 
     def _update_available_widgets(self):
-        """Update the add widget dropdown to show only widgets not yet in theme"""
+        """Update the add widget completions to show only widgets not yet in theme"""
         if not self.current_theme:
             return
 
-        # Get current widgets in theme
-        existing_widgets = set(self.current_theme.get_widget_selectors())
-
-        # Filter out existing widgets from the full list
-        available = [w for w in QT_WIDGET_SELECTORS if w not in existing_widgets]
+        # Hide widgets already in the theme; the shared full list is never copied
+        self._available_model.set_existing(frozenset(self.current_theme.styles))
+
+    # ── Hidden widget list rows ───────────────────────────────────────────────
+
+    def _set_widget_rows(self, selectors: list[str]):
+        """Replace all rows of the widget list and rebuild the row index"""
+        self._bind_text_property_queue(None)
+        self.widget_list.setUpdatesEnabled(False)
+        # The model reset drops the current row — no need to route that through
+        # _on_widget_selected, the caller resets the editor itself
+        with QSignalBlocker(self.widget_list.selectionModel()):
+            self._selectors_model.setStringList(selectors)
+        self.widget_list.setUpdatesEnabled(True)
+        self._widget_row_index = {selector: row for row, selector in enumerate(selectors)}
+
+    def _sync_widget_rows(self, selectors: list[str]):
+        """Update the widget list to selectors, touching only the rows that differ.
+        Leaves no row selected, same as a full rebuild."""
+        new_set = set(selectors)
+        to_remove = self._widget_row_index.keys() - new_set
+        to_add = new_set - self._widget_row_index.keys()
+
+        # Little overlap — a single rebuild is cheaper than many row shifts
+        if len(to_remove) + len(to_add) >= len(selectors):
+            self._set_widget_rows(selectors)
+            return
 
-        # Update combo box
-        self.widget_selector_combo.clear()
-        self.widget_selector_combo.addItems(sorted(available))
+        selection_model = self.widget_list.selectionModel()
+        self.widget_list.setUpdatesEnabled(False)
+        with QSignalBlocker(selection_model):
+            for selector in to_remove:
+                self._remove_widget_row(selector)
+            for selector in sorted(to_add):
+                self._insert_widget_row(selector)
+            self.widget_list.setCurrentIndex(QModelIndex())
+        self.widget_list.setUpdatesEnabled(True)
+        self._bind_text_property_queue(None)
+
+    def _insert_widget_row(self, selector: str):
+        """Insert a selector at its sorted position, shifting later rows down"""
+        row = sum(1 for existing in self._widget_row_index if existing < selector)
+        for existing, existing_row in self._widget_row_index.items():
+            if existing_row >= row:
+                self._widget_row_index[existing] = existing_row + 1
+        self._widget_row_index[selector] = row
+        self._selectors_model.insertRows(row, 1)
+        self._selectors_model.setData(self._selectors_model.index(row), selector)
+
+    def _remove_widget_row(self, selector: str):
+        """Remove a selector's row, shifting later rows up"""
+        row = self._widget_row_index.pop(selector, None)
+        if row is None:
+            return
+        for existing, existing_row in self._widget_row_index.items():
+            if existing_row > row:
+                self._widget_row_index[existing] = existing_row - 1
+        self._selectors_model.removeRows(row, 1)
+
+    def _select_widget_row(self, selector: str) -> bool:
+        """Make selector the current row. Returns False if it is not listed."""
+        row = self._widget_row_index.get(selector)
+        if row is None:
+            return False
+        self.widget_list.setCurrentIndex(self._selectors_model.index(row))
+        return True
+
+    def _current_selector(self) -> Optional[str]:
+        """Selector of the current widget list row, or None"""
+        index = self.widget_list.currentIndex()
+        return index.data() if index.isValid() else None
+
+    @pyqtSlot(QModelIndex, QModelIndex)
+    def _on_widget_index_changed(self, current: QModelIndex, _previous: QModelIndex):
+        """Forward widget list current-row changes as a selector string"""
+        self._on_widget_selected(current.data() if current.isValid() else "")
 
     def _on_widget_selected(self, widget_selector: str):
         """Handle widget selection in list"""
+        self._flush_pending_edits()
+        self._bind_text_property_queue(widget_selector)
         if not widget_selector or not self.current_theme:
             return
 
@@ -872,9 +1426,7 @@ class QtWidgetThemeEditor(QWidget):
         self.updating_from_code = True
 
         # Update raw CSS editor
-        self.style_edit.blockSignals(True)
-        self.style_edit.setPlainText(style or "")
-        self.style_edit.blockSignals(False)
+        self._set_style_text(style or "")
 
         # Update label
         self.current_widget_label.setText(f"Editing: {widget_selector}")
@@ -897,19 +1449,19 @@ class QtWidgetThemeEditor(QWidget):
         if not self.current_theme:
             return
 
+        widget_selector = sys.intern(widget_selector)
+
         # Check if widget exists in theme, if not add it
-        if widget_selector not in self.current_theme.get_widget_selectors():
+        if widget_selector not in self.current_theme.styles:
             # Add the widget with empty style
             self.current_theme.add_widget_style(widget_selector, "")
-            self.widget_list.addItem(widget_selector)
+            self._insert_widget_row(widget_selector)
             self._update_available_widgets()
 
         # Find and select the widget in the list
-        items = self.widget_list.findItems(widget_selector, Qt.MatchFlag.MatchExactly)
-        if items:
-            self.widget_list.setCurrentItem(items[0])
+        if self._select_widget_row(widget_selector):
             # Scroll to make it visible
-            self.widget_list.scrollToItem(items[0])
+            self.widget_list.scrollTo(self.widget_list.currentIndex())
 
         # Highlight the corresponding selector button
         base_class = widget_selector.split(':')[0].split(' ')[0]
@@ -924,18 +1476,17 @@ class QtWidgetThemeEditor(QWidget):
         primary_selector = qt_class  # default fallback
         for _name, _icon, qc, sel in WIDGET_BUTTONS:
             if qc == qt_class:
-                primary_selector = sel
+                primary_selector = sys.intern(sel)
                 break
 
         if self.current_theme:
-            selectors = self.current_theme.get_widget_selectors()
             # Find an existing selector for this widget type
             target = None
-            if primary_selector in selectors:
+            if primary_selector in self.current_theme.styles:
                 target = primary_selector
             else:
                 # Broaden: any selector whose base class matches
-                for s in selectors:
+                for s in self.current_theme.get_widget_selectors():
                     base = s.split(':')[0].split(' ')[0]
                     if base == qt_class:
                         target = s
@@ -945,15 +1496,12 @@ class QtWidgetThemeEditor(QWidget):
                 # Not in theme yet — add it with a default style
                 default = self._get_default_style(primary_selector)
                 self.current_theme.add_widget_style(primary_selector, default)
-                self.widget_list.addItem(primary_selector)
+                self._insert_widget_row(primary_selector)
                 self._update_available_widgets()
                 target = primary_selector
 
             # Select in the hidden widget_list so existing methods work
-            items = self.widget_list.findItems(target, Qt.MatchFlag.MatchExactly)
-            if items:
-                self.widget_list.setCurrentItem(items[0])
-            else:
+            if not self._select_widget_row(target):
                 # Manually trigger the editor update
                 self._load_selector_into_editor(target)
         else:
@@ -964,18 +1512,26 @@ class QtWidgetThemeEditor(QWidget):
 
     def _load_selector_into_editor(self, widget_selector: str):
         """Directly populate the style editor for the given selector."""
+        self._flush_pending_edits()
+        self._bind_text_property_queue(widget_selector)
         if not self.current_theme:
             return
         style = self.current_theme.get_widget_style(widget_selector) or ""
         self.updating_from_code = True
-        self.style_edit.blockSignals(True)
-        self.style_edit.setPlainText(style)
-        self.style_edit.blockSignals(False)
+        self._set_style_text(style)
         self.current_widget_label.setText(f"Editing: {widget_selector}")
         self._update_widget_preview(widget_selector, style)
         self._update_visual_properties(style)
         self.updating_from_code = False
 
+    def _set_style_text(self, text: str):
+        """Replace the raw CSS editor text, skipping the rewrite when it already matches.
+        Re-selecting the same selector then keeps the cursor and undo history."""
+        if self.style_edit.toPlainText() == text:
+            return
+        with QSignalBlocker(self.style_edit):
+            self.style_edit.setPlainText(text)
+
     def _toggle_usage_panel(self, visible: bool):
         """Show or hide the usage panel pane."""
         self._usage_panel.setVisible(visible)
@@ -989,65 +1545,13 @@ class QtWidgetThemeEditor(QWidget):
         entries = self._selector_panel._entries_by_qt_class.get(qt_class, [])
         self._usage_panel.update_locations(qt_class, entries)
 
-    def _on_style_changed(self):
-        """Handle style text change"""
-        if not self.current_theme or not self.widget_list.currentItem():
-            return
-
-        widget_selector = self.widget_list.currentItem().text()
-        new_style = self.style_edit.toPlainText()
-
-        # Update theme
-        self.current_theme.add_widget_style(widget_selector, new_style)
-        self.unsaved_changes = True
-        self.themeModified.emit()
-
     def _get_default_style(self, widget_selector: str) -> str:
         """Get default style template for a widget type"""
-        # Extract base widget name
-        base = widget_selector.split(':')[0].split('::')[0].strip()
-
-        # Default style templates for common widgets
-        defaults = {
-            "QPushButton": "background-color: #0078D4; color: #FFFFFF; border: 1px solid #555; border-radius: 4px; padding: 6px 12px;",
-            "QLineEdit": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; border-radius: 3px; padding: 4px;",
-            "QTextEdit": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555;",
-            "QComboBox": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; border-radius: 3px; padding: 4px;",
-            "QCheckBox": "color: #FFFFFF; spacing: 5px;",
-            "QCheckBox::indicator": "width: 18px; height: 18px; border: 2px solid #555; border-radius: 3px; background-color: #3C3C3C;",
-            "QCheckBox::indicator:checked": "background-color: #0078D4; border-color: #0078D4;",
-            "QRadioButton": "color: #FFFFFF; spacing: 5px;",
-            "QRadioButton::indicator": "width: 18px; height: 18px; border: 2px solid #555; border-radius: 9px; background-color: #3C3C3C;",
-            "QRadioButton::indicator:checked": "background-color: #0078D4; border-color: #0078D4;",
-            "QLabel": "color: #FFFFFF; background-color: transparent;",
-            "QGroupBox": "color: #FFFFFF; border: 1px solid #555; border-radius: 4px; margin-top: 10px; padding-top: 10px;",
-            "QProgressBar": "border: 1px solid #555; border-radius: 3px; background-color: #3C3C3C; text-align: center;",
-            "QProgressBar::chunk": "background-color: #0078D4; border-radius: 2px;",
-            "QSlider::groove:horizontal": "border: 1px solid #555; height: 6px; background: #3C3C3C; border-radius: 3px;",
-            "QSlider::handle:horizontal": "background: #0078D4; border: 1px solid #555; width: 16px; margin: -5px 0; border-radius: 8px;",
-            "QSpinBox": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; border-radius: 3px; padding: 4px;",
-            "QDateEdit": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; border-radius: 3px; padding: 4px;",
-            "QTimeEdit": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; border-radius: 3px; padding: 4px;",
-            "QListWidget": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555;",
-            "QListWidget::item": "padding: 4px;",
-            "QListWidget::item:selected": "background-color: #0078D4; color: #FFFFFF;",
-            "QTableWidget": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; gridline-color: #555;",
-            "QTreeWidget": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555;",
-            "QScrollBar:vertical": "background: #2B2B2B; width: 12px; border: none;",
-            "QScrollBar::handle:vertical": "background: #555555; border-radius: 6px; min-height: 20px;",
-            "QTabWidget::pane": "border: 1px solid #555; background-color: #2B2B2B;",
-            "QTabBar::tab": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555; padding: 6px 12px;",
-            "QTabBar::tab:selected": "background-color: #0078D4; color: #FFFFFF;",
-            "QMenuBar": "background-color: #2B2B2B; color: #FFFFFF;",
-            "QMenuBar::item": "padding: 4px 8px;",
-            "QMenuBar::item:selected": "background-color: #0078D4;",
-            "QMenu": "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555;",
-            "QMenu::item": "padding: 4px 20px;",
-            "QMenu::item:selected": "background-color: #0078D4;",
-        }
-
-        # Return default for this widget, or a generic default
-        return defaults.get(widget_selector, defaults.get(base, "background-color: #3C3C3C; color: #FFFFFF; border: 1px solid #555;"))
+        if widget_selector in _DEFAULT_STYLES:
+            return _DEFAULT_STYLES[widget_selector]
+        # Fall back to the base widget name ("QTabBar::tab:selected" -> "QTabBar")
+        base = widget_selector.partition(':')[0].strip()
+        return _DEFAULT_STYLES.get(base, _GENERIC_DEFAULT_STYLE)
 
     def _add_widget(self):
         """Add a new widget to the current theme"""
@@ -1055,18 +1559,17 @@ class QtWidgetThemeEditor(QWidget):
             QMessageBox.warning(self, "No Theme", "Please select or create a theme first")
             return
 
-        widget_selector = self.widget_selector_combo.currentText().strip()
+        widget_selector = sys.intern(self.widget_selector_edit.text().strip())
 
         if not widget_selector:
             QMessageBox.warning(self, "Invalid Selector", "Please enter a widget selector")
             return
 
         if widget_selector in self.current_theme.styles:
-            QMessageBox.information(self, "Widget Exists", f"Widget '{widget_selector}' already exists in this theme")
+            self._dup_widget_box.setText(f"Widget '{widget_selector}' already exists in this theme")
+            self._dup_widget_box.exec()
             # Select it in the list
-            items = self.widget_list.findItems(widget_selector, Qt.MatchFlag.MatchExactly)
-            if items:
-                self.widget_list.setCurrentItem(items[0])
+            self._select_widget_row(widget_selector)
             return
 
         # Add widget with default style based on widget type
@@ -1074,27 +1577,24 @@ class QtWidgetThemeEditor(QWidget):
         self.current_theme.add_widget_style(widget_selector, default_style)
 
         # Update widget list
-        self.widget_list.clear()
-        self.widget_list.addItems(self.current_theme.get_widget_selectors())
+        self._insert_widget_row(widget_selector)
 
-        # Update available widgets dropdown
-        self._update_available_widgets()
+        # Update available widgets completions (custom selectors never appear there)
+        if widget_selector in QT_WIDGET_SELECTORS_SET:
+            self._update_available_widgets()
 
         # Select the new widget
-        items = self.widget_list.findItems(widget_selector, Qt.MatchFlag.MatchExactly)
-        if items:
-            self.widget_list.setCurrentItem(items[0])
+        self._select_widget_row(widget_selector)
 
-        self.unsaved_changes = True
-        self.themeModified.emit()
+        self._mark_modified()
 
     def _remove_widget(self):
         """Remove selected widget from theme"""
-        if not self.current_theme or not self.widget_list.currentItem():
+        self._flush_pending_edits()
+        widget_selector = self._current_selector()
+        if not self.current_theme or not widget_selector:
             return
 
-        widget_selector = self.widget_list.currentItem().text()
-
         reply = QMessageBox.question(
             self,
             "Remove Widget",
@@ -1105,21 +1605,23 @@ class QtWidgetThemeEditor(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             self.current_theme.remove_widget_style(widget_selector)
 
-            # Update widget list
-            self.widget_list.clear()
-            self.widget_list.addItems(self.current_theme.get_widget_selectors())
+            # Update widget list (leave nothing selected, as after a rebuild)
+            selection_model = self.widget_list.selectionModel()
+            with QSignalBlocker(selection_model):
+                self._remove_widget_row(widget_selector)
+                self.widget_list.setCurrentIndex(QModelIndex())
+            self._bind_text_property_queue(None)
 
-            # Update available widgets dropdown
-            self._update_available_widgets()
+            # Update available widgets completions (custom selectors never appear there)
+            if widget_selector in QT_WIDGET_SELECTORS_SET:
+                self._update_available_widgets()
 
             # Clear style editor
-            self.style_edit.blockSignals(True)
-            self.style_edit.clear()
-            self.style_edit.blockSignals(False)
+            with QSignalBlocker(self.style_edit):
+                self.style_edit.clear()
             self.current_widget_label.setText("Select a widget to edit")
 
-            self.unsaved_changes = True
-            self.themeModified.emit()
+            self._mark_modified()
 
     def _new_theme(self):
         """Create a new theme"""
@@ -1144,16 +1646,33 @@ class QtWidgetThemeEditor(QWidget):
             self.themes[theme_name] = new_theme
 
             # Update combo box
-            self.theme_combo.blockSignals(True)
-            self.theme_combo.clear()
-            self.theme_combo.addItems(sorted(self.themes.keys()))
-            self.theme_combo.setCurrentText(theme_name)
-            self.theme_combo.blockSignals(False)
+            with QSignalBlocker(self.theme_combo):
+                self._insert_theme_name(theme_name)
+                self.theme_combo.setCurrentText(theme_name)
 
             self._on_theme_changed(theme_name)
 
-            self.unsaved_changes = True
-            self.themeModified.emit()
+            self._mark_modified()
+
+    def _set_theme_names(self, names: list[str]):
+        """Replace the theme combo entries with names (must already be sorted)"""
+        self._theme_names = names
+        self._theme_model.setStringList(names)
+
+    def _insert_theme_name(self, name: str) -> int:
+        """Insert name into the sorted theme list and combo; returns its row"""
+        index = bisect.bisect_left(self._theme_names, name)
+        self._theme_names.insert(index, name)
+        self._theme_model.insertRows(index, 1)
+        self._theme_model.setData(self._theme_model.index(index), name)
+        return index
+
+    def _remove_theme_name(self, name: str):
+        """Remove name from the sorted theme list and combo"""
+        index = bisect.bisect_left(self._theme_names, name)
+        if index < len(self._theme_names) and self._theme_names[index] == name:
+            del self._theme_names[index]
+            self._theme_model.removeRows(index, 1)
 
     def _duplicate_theme(self):
         """Duplicate the current theme"""
@@ -1178,19 +1697,17 @@ class QtWidgetThemeEditor(QWidget):
             self.themes[new_name] = new_theme
 
             # Update combo box
-            self.theme_combo.blockSignals(True)
-            self.theme_combo.clear()
-            self.theme_combo.addItems(sorted(self.themes.keys()))
-            self.theme_combo.setCurrentText(new_name)
-            self.theme_combo.blockSignals(False)
+            with QSignalBlocker(self.theme_combo):
+                self._insert_theme_name(new_name)
+                self.theme_combo.setCurrentText(new_name)
 
             self._on_theme_changed(new_name)
 
-            self.unsaved_changes = True
-            self.themeModified.emit()
+            self._mark_modified()
 
     def _delete_theme(self):
         """Delete the current theme"""
+        self._flush_pending_edits()
         if not self.current_theme:
             return
 
@@ -1203,14 +1720,13 @@ class QtWidgetThemeEditor(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             del self.themes[self.current_theme_name]
+            self._qss_cache.pop(id(self.current_theme), None)
 
             # Update combo box
-            self.theme_combo.blockSignals(True)
-            self.theme_combo.clear()
-            if self.themes:
-                self.theme_combo.addItems(sorted(self.themes.keys()))
-                self.theme_combo.setCurrentIndex(0)
-            self.theme_combo.blockSignals(False)
+            with QSignalBlocker(self.theme_combo):
+                self._remove_theme_name(self.current_theme_name)
+                if self.themes:
+                    self.theme_combo.setCurrentIndex(0)
 
             if self.themes:
                 self._on_theme_changed(self.theme_combo.currentText())
@@ -1218,11 +1734,11 @@ class QtWidgetThemeEditor(QWidget):
                 self.current_theme = None
                 self.current_theme_name = None
 
-            self.unsaved_changes = True
-            self.themeModified.emit()
+            self._mark_modified()
 
     def _new_file(self):
         """Start a new file with empty themes"""
+        self._flush_pending_edits()
         if self.unsaved_changes:
             reply = QMessageBox.question(
                 self,
@@ -1235,23 +1751,24 @@ class QtWidgetThemeEditor(QWidget):
 
         # Clear everything
         self.themes = {}
+        self._qss_cache.clear()
+        _parse_declarations.cache_clear()
         self.current_theme_name = None
         self.current_theme = None
         self.current_file_path = None
         self.unsaved_changes = False
 
         # Clear UI
-        self.theme_combo.blockSignals(True)
-        self.theme_combo.clear()
-        self.theme_combo.blockSignals(False)
+        with QSignalBlocker(self.theme_combo):
+            self._set_theme_names([])
 
-        self.widget_list.clear()
+        self._set_widget_rows([])
         self.style_edit.clear()
         self.current_widget_label.setText("Select a widget to edit")
 
         # Update file status
         self.file_status_label.setText("New file (not saved yet) - use 'Save' to choose location")
-        self.file_status_label.setStyleSheet("color: #4CAF50; font-weight: bold; padding: 5px; background-color: #3C3C3C; border-radius: 3px;")
+        self._set_file_status_loaded(True)
 
         QMessageBox.information(
             self,
@@ -1261,53 +1778,47 @@ class QtWidgetThemeEditor(QWidget):
 
     def _save_themes(self):
         """Save all themes to file"""
+        self._flush_pending_edits()
         try:
             # Block signals to prevent any focus changes from triggering unsaved changes
-            self.style_edit.blockSignals(True)
-
-            # CRITICAL: Save to the currently loaded file, NOT the default file!
-            if self.current_file_path is None:
-                # No file loaded yet - prompt user to choose location
-                from PyQt6.QtWidgets import QFileDialog
-                filename, _ = QFileDialog.getSaveFileName(
+            with QSignalBlocker(self.style_edit):
+                # CRITICAL: Save to the currently loaded file, NOT the default file!
+                if self.current_file_path is None:
+                    # No file loaded yet - prompt user to choose location
+                    filename, _ = QFileDialog.getSaveFileName(
+                        self,
+                        "Save Qt Widget Themes",
+                        self._default_save_path,
+                        "JSON Files (*.json);;All Files (*)"
+                    )
+
+                    if not filename:
+                        return  # User cancelled
+
+                    self.current_file_path = filename
+
+                # Save to the tracked file
+                self.theme_manager.save_qt_widget_themes(self.themes, filepath=self.current_file_path)
+                self.unsaved_changes = False
+
+                # Update file status label
+                self._update_file_status_label()
+
+                # Show success message
+                QMessageBox.information(
                     self,
-                    "Save Qt Widget Themes",
-                    str(self.theme_manager.qt_widget_themes_dir / "qt_themes.json"),
-                    "JSON Files (*.json);;All Files (*)"
+                    "Success",
+                    f"Qt widget themes saved successfully to:\n{self.current_file_path}"
                 )
-
-                if not filename:
-                    self.style_edit.blockSignals(False)
-                    return  # User cancelled
-
-                self.current_file_path = filename
-
-            # Save to the tracked file
-            self.theme_manager.save_qt_widget_themes(self.themes, filepath=self.current_file_path)
-            self.unsaved_changes = False
-
-            # Update file status label
-            self._update_file_status_label()
-
-            # Show success message
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Qt widget themes saved successfully to:\n{self.current_file_path}"
-            )
-
-            # Unblock signals
-            self.style_edit.blockSignals(False)
         except Exception as e:
-            self.style_edit.blockSignals(False)
             QMessageBox.critical(self, "Error", f"Failed to save themes:\n{e}")
 
     def _save_as(self):
         """Save themes to a new file"""
-        from PyQt6.QtWidgets import QFileDialog
+        self._flush_pending_edits()
 
         # Suggest current location or default
-        suggested_path = self.current_file_path if self.current_file_path else str(self.theme_manager.qt_widget_themes_dir / "qt_themes.json")
+        suggested_path = self.current_file_path or self._default_save_path
 
         filename, _ = QFileDialog.getSaveFileName(
             self,
@@ -1344,113 +1855,175 @@ class QtWidgetThemeEditor(QWidget):
         """Update the file status label to show currently loaded file"""
         if self.current_file_path:
             self.file_status_label.setText(f"Editing: {self.current_file_path}")
-            self.file_status_label.setStyleSheet("color: #4CAF50; font-weight: bold; padding: 5px; background-color: #3C3C3C; border-radius: 3px;")
+            self._set_file_status_loaded(True)
         else:
             self.file_status_label.setText("No file loaded - click 'Load from File...' or 'New File' to start")
-            self.file_status_label.setStyleSheet("color: #FF9800; font-weight: bold; padding: 5px; background-color: #3C3C3C; border-radius: 3px;")
+            self._set_file_status_loaded(False)
+
+    def _set_file_status_loaded(self, loaded: bool):
+        """Switch the file status label between its loaded (green) and idle (orange) look"""
+        if self.file_status_label.property("fileLoaded") == loaded:
+            return
+        self.file_status_label.setProperty("fileLoaded", loaded)
+        # Property selectors are only re-evaluated on polish — repolish just this label
+        style = self.file_status_label.style()
+        style.unpolish(self.file_status_label)
+        style.polish(self.file_status_label)
 
     def _load_from_file(self):
         """Load Qt Widget themes from external JSON file.
-        Also accepts Claude_DB themes.json format and converts it automatically."""
-        from PyQt6.QtWidgets import QFileDialog
-        import json
+        Also accepts Claude_DB themes.json format and converts it automatically.
+        The file is read and parsed on a worker thread; _on_themes_loaded
+        populates the editor once it is done."""
+
+        # File→Open reaches here even while the editor's own buttons are disabled
+        if self._loader is not None:
+            QMessageBox.information(self, "Loading", "A theme file is still loading.")
+            return
 
         filename, _ = QFileDialog.getOpenFileName(
             self,
             "Load Qt Widget Themes",
-            str(self.theme_manager.qt_widget_themes_dir),
+            self._default_load_dir,
             "JSON Files (*.json);;All Files (*)"
         )
 
         if not filename:
             return
 
-        try:
-            raw = json.loads(Path(filename).read_text(encoding="utf-8"))
-
-            # ── Detect and convert Claude_DB format ──────────────────────────
-            converted = False
-            if _is_claude_db_format(raw):
-                # Claude_DB file: { "ThemeName": { "globals": {...}, "widgets": {...} } }
-                converted_themes = {}
-                for theme_name, theme_body in raw.items():
-                    if not isinstance(theme_body, dict):
-                        continue
-                    widgets_section = theme_body.get("widgets", theme_body)
-                    css_map = _convert_claude_db_theme(widgets_section)
-                    if css_map:
-                        converted_themes[theme_name] = css_map
-                if not converted_themes:
-                    QMessageBox.warning(self, "Conversion Failed",
-                                        "File looks like a Claude_DB theme but could not be converted.")
-                    return
-                # Build QtWidgetTheme objects from the converted CSS map
-                loaded_themes = {}
-                for tname, css_map in converted_themes.items():
-                    qt_theme = QtWidgetTheme(name=tname)
-                    for selector, css in css_map.items():
-                        qt_theme.add_widget_style(selector, css)
-                    loaded_themes[tname] = qt_theme
-                converted = True
-            else:
-                # ── Standard Theme_Editor format ─────────────────────────────
-                loaded_themes = self.theme_manager.load_qt_widget_themes(filename)
+        self._flush_pending_edits()
 
-            if not loaded_themes:
-                QMessageBox.warning(self, "No Themes",
-                                    f"No valid Qt Widget themes found in:\n{filename}")
-                return
+        # Disable theme controls until the worker reports back
+        self._set_theme_controls_enabled(False)
 
-            self.themes = loaded_themes
-            # For converted files don't save back to the source path by default
-            self.current_file_path = None if converted else filename
+        self._loader = _ThemeFileLoader(self.theme_manager, filename, self)
+        self._loader.loaded.connect(self._on_themes_loaded)
+        self._loader.failed.connect(self._on_themes_load_failed)
+        self._loader.finished.connect(self._loader.deleteLater)
+        self._loader.start()
 
-            self.theme_combo.blockSignals(True)
-            self.theme_combo.clear()
-            self.theme_combo.addItems(sorted(self.themes.keys()))
-            self.theme_combo.blockSignals(False)
+    def _set_theme_controls_enabled(self, enabled: bool):
+        """Enable/disable theme selection and file buttons (used while loading)"""
+        for widget in (self.theme_combo, self.new_theme_btn, self.duplicate_theme_btn,
+                       self.delete_theme_btn, self.new_file_btn, self.load_file_btn,
+                       self.save_btn, self.save_as_btn):
+            widget.setEnabled(enabled)
 
-            if self.themes:
-                self.theme_combo.setCurrentIndex(0)
-                self._on_theme_changed(self.theme_combo.currentText())
+    def _stop_loader(self):
+        """Drop a running load and wait for its thread, so the editor can be torn down"""
+        loader, self._loader = self._loader, None
+        if loader is None:
+            return
+        loader.loaded.disconnect(self._on_themes_loaded)
+        loader.failed.disconnect(self._on_themes_load_failed)
+        loader.wait()
+        self._set_theme_controls_enabled(True)
+
+    def _on_themes_loaded(self, filename: str, loaded_themes: dict, converted: bool):
+        """Populate the editor with themes parsed by the loader thread"""
+        # Results of a load that was dropped in the meantime
+        if self.sender() is not self._loader:
+            return
+        self._loader = None
+        self._set_theme_controls_enabled(True)
 
-            self.unsaved_changes = converted   # converted = unsaved (different format)
-            self.themeModified.emit()
-            self._update_file_status_label()
+        if converted and not loaded_themes:
+            QMessageBox.warning(self, "Conversion Failed",
+                                "File looks like a Claude_DB theme but could not be converted.")
+            return
 
-            msg = (f"Converted {len(loaded_themes)} Claude_DB theme(s) from:\n{filename}\n\n"
-                   "Use 'Save As…' to save in Theme_Editor format."
-                   if converted else
-                   f"Loaded {len(loaded_themes)} theme(s) from:\n{filename}\n\nChanges will be saved to this file.")
-            QMessageBox.information(self, "File Loaded", msg)
+        if not loaded_themes:
+            QMessageBox.warning(self, "No Themes",
+                                f"No valid Qt Widget themes found in:\n{filename}")
+            return
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load themes:\n{e}")
+        self.themes = loaded_themes
+        self._qss_cache.clear()
+        _parse_declarations.cache_clear()
+        # For converted files don't save back to the source path by default
+        self.current_file_path = None if converted else filename
+
+        with QSignalBlocker(self.theme_combo):
+            self._set_theme_names(sorted(self.themes))
+
+        if self.themes:
+            self.theme_combo.setCurrentIndex(0)
+            self._on_theme_changed(self.theme_combo.currentText())
+
+        self.unsaved_changes = converted   # converted = unsaved (different format)
+        self._modified_timer.start()
+        self._update_file_status_label()
+
+        msg = (f"Converted {len(loaded_themes)} Claude_DB theme(s) from:\n{filename}\n\n"
+               "Use 'Save As…' to save in Theme_Editor format."
+               if converted else
+               f"Loaded {len(loaded_themes)} theme(s) from:\n{filename}\n\nChanges will be saved to this file.")
+        QMessageBox.information(self, "File Loaded", msg)
+
+    def _on_themes_load_failed(self, filename: str, error: str):
+        """Report a load error from the loader thread"""
+        if self.sender() is not self._loader:
+            return
+        self._loader = None
+        self._set_theme_controls_enabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to load themes:\n{error}")
 
     def _open_theme(self):
         """Open theme file (wrapper for main.py compatibility)"""
         self._load_from_file()
 
+    def _schedule_apply_preview(self):
+        """Restyle the full preview panel after a short pause in editing"""
+        self._apply_timer.start()
+
     def _apply_preview(self):
-        """Apply current theme to preview panel and force all widgets to repaint."""
+        """Apply current theme to preview panel.
+
+        One setStyleSheet() on the panel cascades to every child and Qt
+        re-polishes them itself; the preview children carry no stylesheets
+        of their own, so there is nothing to override the cascade.
+        """
+        # A direct apply supersedes a scheduled one
+        self._apply_timer.stop()
         if not self.current_theme:
             return
 
-        stylesheet = self.current_theme.generate_stylesheet()
-        self.preview_panel.setStyleSheet(stylesheet)
+        stylesheet = self._cached_stylesheet(self.current_theme)
+
+        # setStyleSheet() re-polishes even when the string is identical -
+        # compare the cheap hash first, then the full string on a hash match
+        css_hash = hash(stylesheet)
+        if css_hash == self._last_applied_hash and stylesheet == self._last_applied_css:
+            return
 
-        # Qt caches widget rendering — unpolish/polish forces the style engine
-        # to re-read the new stylesheet for every child widget.
-        style = self.preview_panel.style()
-        style.unpolish(self.preview_panel)
-        style.polish(self.preview_panel)
-        for child in self.preview_panel.findChildren(QWidget):
-            style.unpolish(child)
-            style.polish(child)
-            child.update()
+        # Repolishing every child would otherwise schedule paints piecemeal;
+        # re-enabling updates repaints the whole panel once
+        self.preview_panel.setUpdatesEnabled(False)
+        try:
+            self.preview_panel.setStyleSheet(stylesheet)
+        finally:
+            self.preview_panel.setUpdatesEnabled(True)
+        self._last_applied_css = stylesheet
+        self._last_applied_hash = css_hash
+
+    def _cached_stylesheet(self, theme: QtWidgetTheme) -> str:
+        """Return theme's generated stylesheet, regenerated only when its styles change"""
+        # One entry per theme: id -> (theme, styles_version, stylesheet). The theme
+        # itself is kept so a recycled id can never match a different theme.
+        entry = self._qss_cache.get(id(theme))
+        if entry is None or entry[0] is not theme or entry[1] != theme.styles_version:
+            entry = (theme, theme.styles_version, theme.generate_stylesheet())
+            self._qss_cache[id(theme)] = entry
+        return entry[2]
+
+    def _mark_modified(self):
+        """Flag unsaved changes; themeModified fires once the event loop is idle"""
+        self.unsaved_changes = True
+        self._modified_timer.start()
 
     def has_unsaved_changes(self) -> bool:
         """Check if there are unsaved changes"""
+        self._flush_pending_edits()
         return self.unsaved_changes
 
     def _toggle_css_editor(self):
@@ -1461,18 +2034,55 @@ class QtWidgetThemeEditor(QWidget):
         else:
             self.style_edit.setVisible(False)
             self.show_css_btn.setText("▼ Show Raw CSS")
+        self._refresh_deferred_properties()
 
+    def showEvent(self, event):
+        """Build any property rows that were deferred while the editor was hidden"""
+        super().showEvent(event)
+        self._refresh_deferred_properties()
+
+    def _refresh_deferred_properties(self):
+        """Run a skipped _update_visual_properties / preview render once on screen"""
+        if self._dirty_for_selection:
+            self._update_visual_properties(self._cached_style)
+        if self._preview_dirty is not None:
+            self._update_widget_preview(*self._preview_dirty)
+
+    @pyqtSlot()
     def _on_raw_style_changed(self):
-        """Handle raw CSS text changes"""
+        """Handle raw CSS text changes — applied after a short typing pause"""
         if self.updating_from_code:
             return
 
-        if not self.current_theme or not self.widget_list.currentItem():
+        self._pending_raw_selector = self._current_selector()
+        self._css_debounce.start()
+
+    def _flush_pending_edits(self):
+        """Apply debounced raw CSS and property edits before the editor is repointed"""
+        self._flush_raw_style()
+        self._flush_css_update()
+
+    def _flush_raw_style(self):
+        """Apply a pending raw CSS edit now, before the editor is repointed"""
+        if self._css_debounce.isActive():
+            self._css_debounce.stop()
+            self._apply_raw_style_now()
+
+    @pyqtSlot()
+    def _apply_raw_style_now(self):
+        """Apply the raw CSS editor text to the selector it was typed for"""
+        widget_selector = self._pending_raw_selector
+        self._pending_raw_selector = None
+        if not self.current_theme or not widget_selector:
             return
 
-        widget_selector = self.widget_list.currentItem().text()
         new_style = self.style_edit.toPlainText()
 
+        # textChanged also fires for no-op edits — only react to real changes
+        old_style = self.current_theme.get_widget_style(widget_selector) or ""
+        if new_style is old_style or new_style == old_style:
+            return
+
         # Update theme
         self.current_theme.add_widget_style(widget_selector, new_style)
 
@@ -1482,211 +2092,125 @@ class QtWidgetThemeEditor(QWidget):
         self._update_widget_preview(widget_selector, new_style)
         self.updating_from_code = False
 
-        # Auto-update the full preview panel immediately
-        self._apply_preview()
-
-        self.unsaved_changes = True
-        self.themeModified.emit()
+        # Auto-update the full preview panel once edits pause
+        self._schedule_apply_preview()
 
-    def _update_widget_preview(self, widget_selector: str, style: str):
-        """Update the widget preview to show what it looks like"""
-        # Clear old preview
-        layout = self.widget_preview_container.layout()
-        while layout.count() > 0:
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Create appropriate widget based on selector
-        preview_widget = self._create_preview_widget(widget_selector)
-
-        if preview_widget:
-            # Apply the style to the preview widget
-            preview_widget.setStyleSheet(f"{widget_selector} {{ {style} }}")
-            layout.addWidget(preview_widget)
-        else:
-            # Fallback: show text
-            label = QLabel(f"Preview for {widget_selector}")
-            layout.addWidget(label)
+        self._mark_modified()
 
-    def _create_preview_widget(self, selector: str):
-        """Create an actual Qt widget based on the selector"""
-        # Extract base widget name (without pseudo-states)
-        base_selector = selector.split(':')[0].split('::')[0].strip()
-
-        if base_selector == "QPushButton":
-            btn = QPushButton("Sample Button")
-            return btn
-        elif base_selector == "QLineEdit":
-            edit = QLineEdit()
-            edit.setPlaceholderText("Sample text...")
-            return edit
-        elif base_selector == "QLabel":
-            return QLabel("Sample Label")
-        elif base_selector == "QComboBox":
-            combo = QComboBox()
-            combo.addItems(["Option 1", "Option 2", "Option 3"])
-            return combo
-        elif base_selector == "QCheckBox":
-            return QCheckBox("Sample Checkbox")
-        elif base_selector == "QRadioButton":
-            return QRadioButton("Sample Radio")
-        elif base_selector == "QProgressBar":
-            progress = QProgressBar()
-            progress.setValue(65)
-            return progress
-        elif base_selector == "QSlider":
-            slider = QSlider(Qt.Orientation.Horizontal)
-            slider.setValue(50)
-            return slider
-        elif base_selector == "QSpinBox":
-            spinbox = QSpinBox()
-            spinbox.setValue(50)
-            return spinbox
-        elif base_selector == "QDoubleSpinBox":
-            spinbox = QDoubleSpinBox()
-            spinbox.setValue(3.14)
-            return spinbox
-        elif base_selector == "QDateEdit":
-            date_edit = QDateEdit()
-            from PyQt6.QtCore import QDate
-            date_edit.setDate(QDate.currentDate())
-            date_edit.setCalendarPopup(True)
-            return date_edit
-        elif base_selector == "QTimeEdit":
-            time_edit = QTimeEdit()
-            from PyQt6.QtCore import QTime
-            time_edit.setTime(QTime.currentTime())
-            return time_edit
-        elif base_selector == "QDateTimeEdit":
-            datetime_edit = QDateTimeEdit()
-            from PyQt6.QtCore import QDateTime
-            datetime_edit.setDateTime(QDateTime.currentDateTime())
-            return datetime_edit
-        elif base_selector == "QTextEdit":
-            edit = QTextEdit()
-            edit.setPlaceholderText("Sample text...")
-            edit.setMaximumHeight(60)
-            return edit
-        elif base_selector == "QListWidget":
-            list_widget = QListWidget()
-            list_widget.addItems(["Item 1", "Item 2", "Item 3"])
-            list_widget.setMaximumHeight(80)
-            return list_widget
-        elif base_selector == "QGroupBox":
-            group = QGroupBox("Sample Group")
-            layout = QVBoxLayout(group)
-            layout.addWidget(QLabel("Content"))
-            return group
-        elif base_selector == "QTabWidget":
-            tabs = QTabWidget()
-            tabs.addTab(QLabel("Tab 1 Content"), "Tab 1")
-            tabs.addTab(QLabel("Tab 2 Content"), "Tab 2")
-            tabs.setMaximumHeight(100)
-            return tabs
-
-        # Default: just show a widget
-        return QWidget()
+    @pyqtSlot()
+    def _flush_preview(self):
+        """Render the latest deferred single-widget preview"""
+        pending, self._pending_preview = self._pending_preview, None
+        if pending is not None:
+            self._update_widget_preview(*pending)
 
-    def _update_visual_properties(self, style: str):
-        """Parse CSS and create visual property controls using QFormLayout"""
-        from PyQt6.QtWidgets import QFormLayout
-        from .color_picker import ColorPickerButton
-
-        # Clear existing properties (remove form layout if exists)
-        while self.props_layout.count() > 1:  # Keep the stretch
-            item = self.props_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                # Delete the form layout and all its children
-                layout = item.layout()
-                while layout.count():
-                    child = layout.takeAt(0)
-                    if child.widget():
-                        child.widget().deleteLater()
-
-        if not style:
+    def _update_widget_preview(self, widget_selector: str, style: str):
+        """Update the widget preview to show what it looks like.
+        Preview widgets are built once per base selector and only restyled afterwards."""
+        # A direct update supersedes any deferred one
+        self._pending_preview = None
+
+        # Same selector and style as the preview already shows - skip the restyle
+        preview_key = (widget_selector, style)
+        if preview_key == self._last_preview_key:
             return
 
-        # Parse CSS properties
-        properties = self._parse_css_properties(style)
-
-        if not properties:
+        # Off screen (editor tab in the background, window minimized) - render on show
+        if not self.widget_preview_container.isVisible():
+            self._preview_dirty = preview_key
             return
+        self._preview_dirty = None
+        self._last_preview_key = preview_key
 
-        # Create a QFormLayout for proper label-field alignment
-        form_layout = QFormLayout()
-        form_layout.setSpacing(8)
-        form_layout.setHorizontalSpacing(12)
-        form_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
-        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        form_layout.setFormAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-
-        # Create controls for each property
-        for prop_name, prop_value in properties.items():
-            # Check if it's a color property (look for color keywords OR hex values anywhere in the value)
-            is_color_prop = any(color_word in prop_name.lower() for color_word in ['color', 'background', 'border'])
-            has_hex = '#' in prop_value
-            is_named_color = prop_value.lower() in ['transparent', 'none', 'black', 'white', 'red', 'green', 'blue', 'yellow', 'cyan', 'magenta', 'gray', 'grey']
-
-            if is_color_prop and (has_hex or is_named_color):
-                # Extract the actual color value from the property
-                # Handle cases like "5px solid #D5A200" or "1px solid transparent"
-                color_value = self._extract_color_from_value(prop_value)
-                if color_value:
-                    # Color picker button
-                    color_picker = ColorPickerButton(color_value)
-                    color_picker.colorChanged.connect(lambda c, p=prop_name: self._on_color_changed(p, c))
-                    form_layout.addRow(f"{prop_name}:", color_picker)
-                else:
-                    # Fallback to text edit if we can't extract color
-                    text_edit = QLineEdit(prop_value)
-                    text_edit.textChanged.connect(lambda t, p=prop_name: self._on_text_property_changed(p, t))
-                    form_layout.addRow(f"{prop_name}:", text_edit)
-
-            elif prop_name in ['padding', 'margin', 'border-width'] and prop_value.replace('px', '').strip().isdigit():
-                # Spinbox for dimensions
-                spinbox = QSpinBox()
-                spinbox.setRange(0, 100)
-                spinbox.setValue(int(prop_value.replace('px', '').strip()))
-                spinbox.setSuffix(" px")
-                spinbox.valueChanged.connect(lambda v, p=prop_name: self._on_dimension_changed(p, v))
-                form_layout.addRow(f"{prop_name}:", spinbox)
-
-            elif prop_name == 'border-radius' and 'px' in prop_value:
-                # Spinbox for border radius
-                spinbox = QSpinBox()
-                spinbox.setRange(0, 50)
-                spinbox.setValue(int(prop_value.replace('px', '').strip()))
-                spinbox.setSuffix(" px")
-                spinbox.valueChanged.connect(lambda v, p=prop_name: self._on_dimension_changed(p, v))
-                form_layout.addRow(f"{prop_name}:", spinbox)
+        # Extract base widget name (without pseudo-states)
+        base_selector = widget_selector.split(':')[0].split('::')[0].strip()
 
+        # Page switch, restyle and (first time) construction paint once
+        self.widget_preview_container.setUpdatesEnabled(False)
+        try:
+            preview_widget = self._preview_cache.get(base_selector)
+            if preview_widget is None:
+                factory = _PREVIEW_FACTORIES.get(base_selector)
+                if factory is not None:
+                    preview_widget = factory()
+                    self._preview_cache[base_selector] = preview_widget
+                    self._preview_stack.addWidget(preview_widget)
+
+            if preview_widget is not None:
+                # Apply the style to the preview widget, unless it already carries it
+                # (e.g. switching back to a selector whose style hasn't changed)
+                qss = f"{widget_selector} {{ {style} }}"
+                if self._preview_qss.get(base_selector) != qss:
+                    self._preview_qss[base_selector] = qss
+                    preview_widget.setStyleSheet(qss)
             else:
-                # Text field for other properties
-                text_edit = QLineEdit(prop_value)
-                text_edit.textChanged.connect(lambda t, p=prop_name: self._on_text_property_changed(p, t))
-                form_layout.addRow(f"{prop_name}:", text_edit)
+                # Fallback: show text
+                preview_widget = self.widget_preview
+                preview_widget.setText(f"Preview for {widget_selector}")
+            self._preview_stack.setCurrentWidget(preview_widget)
+        finally:
+            self.widget_preview_container.setUpdatesEnabled(True)
+
+    def _ensure_prop_row(self, index: int) -> "_PropRow":
+        """Return pooled property row index, growing the pool by one if needed"""
+        if index == len(self._row_pool):
+            row = _PropRow(self)
+            self._props_form.addRow(row.label, row.field)
+            self._row_pool.append(row)
+        return self._row_pool[index]
+
+    def _update_visual_properties(self, style: str):
+        """Parse CSS and show one pooled form row per property.
+        Rows are reused across selections; surplus rows are hidden, never deleted."""
+        if not (self._props_scroll.isVisible() or self.style_edit.isVisible()):
+            # Nothing on screen — parse later, when a panel is shown
+            self._cached_style = style
+            self._dirty_for_selection = True
+            return
+        self._dirty_for_selection = False
 
-        # Insert the form layout into the main props layout
-        self.props_layout.insertLayout(self.props_layout.count() - 1, form_layout)
+        properties = _parse_declarations(style) if style else ()
 
-    def _parse_css_properties(self, style: str) -> dict:
-        """Parse CSS style string into property dict"""
-        properties = {}
-        if not style:
-            return properties
+        # Collapse the row show/hide/relabel churn into a single repaint
+        self._props_widget.setUpdatesEnabled(False)
+        try:
+            for index, (prop_name, prop_value) in enumerate(properties):
+                row = self._ensure_prop_row(index)
+
+                # Check if it's a color property (look for color keywords OR hex values anywhere in the value)
+                prop_lower = prop_name.lower()
+                is_color_prop = any(color_word in prop_lower for color_word in _COLOR_PROP_WORDS)
+
+                if is_color_prop and ('#' in prop_value or prop_value.lower() in _PICKER_NAMED_COLORS):
+                    # Extract the actual color value from the property
+                    # Handle cases like "5px solid #D5A200" or "1px solid transparent"
+                    color_value = self._extract_color_from_value(prop_value)
+                    if color_value:
+                        # Color picker button
+                        row.show_color(prop_name, color_value)
+                    else:
+                        # Fallback to text edit if we can't extract color
+                        row.show_text(prop_name, prop_value)
+
+                elif prop_name in _DIMENSION_PROPS and (px_match := _PX_INT_RE.fullmatch(prop_value)):
+                    # Spinbox for dimensions
+                    row.show_spin(prop_name, int(px_match.group(1)), 100)
+
+                elif prop_name == 'border-radius' and (px_match := _PX_INT_RE.fullmatch(prop_value)) and px_match.group(2):
+                    # Spinbox for border radius
+                    row.show_spin(prop_name, int(px_match.group(1)), 50)
 
-        # Split by semicolon
-        parts = [p.strip() for p in style.split(';') if p.strip()]
+                else:
+                    # Text field for other properties
+                    row.show_text(prop_name, prop_value)
 
-        for part in parts:
-            if ':' in part:
-                prop, value = part.split(':', 1)
-                properties[prop.strip()] = value.strip()
+                self._props_form.setRowVisible(index, True)
 
-        return properties
+            # Hide pooled rows not needed for this style
+            for index in range(len(properties), len(self._row_pool)):
+                self._props_form.setRowVisible(index, False)
+        finally:
+            self._props_widget.setUpdatesEnabled(True)
 
     def _extract_color_from_value(self, value: str) -> Optional[str]:
         """Extract color value from a CSS property value
@@ -1697,41 +2221,19 @@ class QtWidgetThemeEditor(QWidget):
         - "transparent" -> "#00000000" (transparent black)
         - "1px solid transparent" -> "#00000000"
         """
-        import re
-
         value_lower = value.lower()
 
         # Check for hex color
-        hex_match = re.search(r'#[0-9A-Fa-f]{6}(?:[0-9A-Fa-f]{2})?', value)
+        hex_match = _HEX_COLOR_RE.search(value)
         if hex_match:
             return hex_match.group(0).upper()
 
-        # Check for named colors (map to hex)
-        named_colors = {
-            'transparent': '#000000',  # Show as black in picker, but we know it's transparent
-            'none': '#000000',
-            'black': '#000000',
-            'white': '#FFFFFF',
-            'red': '#FF0000',
-            'green': '#00FF00',
-            'blue': '#0000FF',
-            'yellow': '#FFFF00',
-            'cyan': '#00FFFF',
-            'magenta': '#FF00FF',
-            'gray': '#808080',
-            'grey': '#808080',
-            'darkgray': '#A9A9A9',
-            'darkgrey': '#A9A9A9',
-            'lightgray': '#D3D3D3',
-            'lightgrey': '#D3D3D3',
-        }
-
         # Check if the entire value is a named color
-        if value_lower in named_colors:
-            return named_colors[value_lower]
+        if value_lower in _NAMED_COLORS:
+            return _NAMED_COLORS[value_lower]
 
         # Check if value contains a named color (e.g., "1px solid transparent")
-        for color_name, hex_val in named_colors.items():
+        for color_name, hex_val in _NAMED_COLOR_ITEMS:
             if color_name in value_lower:
                 return hex_val
 
@@ -1743,20 +2245,17 @@ class QtWidgetThemeEditor(QWidget):
             return
 
         # Get current value to see if we need to replace color within a complex value
-        if not self.current_theme or not self.widget_list.currentItem():
+        widget_selector = self._current_selector()
+        if not self.current_theme or not widget_selector:
             return
 
-        widget_selector = self.widget_list.currentItem().text()
-        current_style = self.current_theme.get_widget_style(widget_selector) or ""
-        properties = self._parse_css_properties(current_style)
-        current_value = properties.get(prop_name, "")
+        current_value = self.current_theme.get_widget_props(widget_selector).get(prop_name, "")
 
         # If the current value contains more than just a color (e.g., "5px solid #D5A200"),
         # replace just the color part
-        import re
         if '#' in current_value:
             # Replace existing hex color with new color
-            new_value = re.sub(r'#[0-9A-Fa-f]{6}(?:[0-9A-Fa-f]{2})?', color, current_value)
+            new_value = _HEX_COLOR_RE.sub(color, current_value)
         elif any(named in current_value.lower() for named in ['transparent', 'none', 'black', 'white', 'red', 'green', 'blue']):
             # Replace named color with hex color
             # This is tricky, let's just replace the whole value for now
@@ -1768,47 +2267,107 @@ class QtWidgetThemeEditor(QWidget):
         self._update_css_property(prop_name, new_value)
 
     def _on_dimension_changed(self, prop_name: str, value: int):
-        """Handle dimension spinbox change"""
-        if self.updating_from_code:
+        """Handle dimension spinbox change — applied after a short pause, like typing"""
+        if self.updating_from_code or self._queue_text_property is None:
             return
-
-        self._update_css_property(prop_name, f"{value}px")
+        self._queue_text_property(prop_name, f"{value}px")
 
     def _on_text_property_changed(self, prop_name: str, value: str):
-        """Handle text property change"""
-        if self.updating_from_code:
+        """Handle text property change — applied after a short typing pause"""
+        if self.updating_from_code or self._queue_text_property is None:
+            return
+        self._queue_text_property(prop_name, value)
+
+    def _bind_text_property_queue(self, widget_selector: Optional[str]):
+        """Specialise the per-keystroke property handler for widget_selector,
+        so selector lookup and theme checks run once per switch, not per key"""
+        if widget_selector and self.current_theme:
+            self._queue_text_property = functools.partial(
+                self._queue_text_update, widget_selector, self.current_theme.get_widget_props)
+        else:
+            self._queue_text_property = None
+
+    def _queue_text_update(self, widget_selector: str, get_props: Callable[[str], Dict[str, str]],
+                           prop_name: str, value: str):
+        """Record a typed property value for widget_selector and restart the debounce"""
+        if widget_selector != self._pending_updates_selector:
+            self._flush_css_update()
+            self._pending_updates_selector = widget_selector
+
+        # textChanged re-fires with the stored value (focus changes, IME commits)
+        # — ignore it unless it reverts a value still waiting to be applied
+        if prop_name not in self._pending_updates and get_props(widget_selector).get(prop_name, "") == value.strip():
             return
 
-        self._update_css_property(prop_name, value)
+        self._pending_updates[prop_name] = value
+        self._update_timer.start()
 
-    def _update_css_property(self, prop_name: str, prop_value: str):
-        """Update a single CSS property in the current style"""
-        if not self.current_theme or not self.widget_list.currentItem():
+    @pyqtSlot()
+    def _flush_css_update(self):
+        """Apply all pending typed property values in a single rebuild"""
+        self._update_timer.stop()
+        if not self._pending_updates:
+            return
+        updates, self._pending_updates = self._pending_updates, {}
+        self._apply_css_updates(self._pending_updates_selector, updates)
+
+    def _patch_style_text(self, new_style: str):
+        """Show new_style in the raw CSS editor by rewriting only the span that
+        differs from the current text, instead of rebuilding the whole document"""
+        old_text = self.style_edit.toPlainText()
+        if old_text == new_style:
             return
 
-        widget_selector = self.widget_list.currentItem().text()
-        current_style = self.current_theme.get_widget_style(widget_selector) or ""
+        # Longest common prefix, then longest common suffix of what remains
+        limit = min(len(old_text), len(new_style))
+        start = 0
+        while start < limit and old_text[start] == new_style[start]:
+            start += 1
+        limit -= start
+        tail = 0
+        while tail < limit and old_text[-1 - tail] == new_style[-1 - tail]:
+            tail += 1
+
+        cursor = QTextCursor(self.style_edit.document())
+        cursor.setPosition(_utf16_len(old_text[:start]))
+        cursor.setPosition(_utf16_len(old_text[:len(old_text) - tail]), QTextCursor.MoveMode.KeepAnchor)
+        with QSignalBlocker(self.style_edit):
+            cursor.beginEditBlock()
+            cursor.insertText(new_style[start:len(new_style) - tail])
+            cursor.endEditBlock()
 
-        # Parse current properties
-        properties = self._parse_css_properties(current_style)
+    def _update_css_property(self, prop_name: str, prop_value: str):
+        """Update a single CSS property in the current style"""
+        self._update_css_properties({sys.intern(prop_name): prop_value})
 
-        # Update property
-        properties[prop_name] = prop_value
+    def _update_css_properties(self, updates: Dict[str, str]):
+        """Update several CSS properties of the current style with one rebuild,
+        one preview refresh and one modified notification"""
+        self._flush_pending_edits()
+        self._apply_css_updates(self._current_selector(), updates)
 
-        # Rebuild CSS string
-        new_style = "; ".join([f"{k}: {v}" for k, v in properties.items()])
+    def _apply_css_updates(self, widget_selector: Optional[str], updates: Dict[str, str]):
+        """Write updated property values into widget_selector's style"""
+        if not self.current_theme or not widget_selector:
+            return
 
-        # Update theme
-        self.current_theme.add_widget_style(widget_selector, new_style)
+        # No-op edit (e.g. a picker reporting the current color) - nothing to redo
+        properties = self.current_theme.get_widget_props(widget_selector)
+        if all(properties.get(name, "") == value.strip() for name, value in updates.items()):
+            return
+
+        # Update theme — the parsed properties are kept on the theme, so this
+        # is a dict update plus one splice (a blank value empties it in place)
+        new_style = self.current_theme.set_widget_props(widget_selector, updates)
 
         # Update raw CSS editor
         self.updating_from_code = True
-        self.style_edit.setPlainText(new_style)
-        self._update_widget_preview(widget_selector, new_style)
+        self._patch_style_text(new_style)
         self.updating_from_code = False
+        self._pending_preview = (widget_selector, new_style)
+        self._preview_timer.start()
 
-        # Auto-update the full preview panel immediately
-        self._apply_preview()
+        # Auto-update the full preview panel once edits pause
+        self._schedule_apply_preview()
 
-        self.unsaved_changes = True
-        self.themeModified.emit()
+        self._mark_modified()
@@ -3,9 +3,80 @@ Theme Data Classes
 Data structures for different theme formats (Terminal JSON, QSS, CustomTkinter)
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, List, Any
+import functools
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, List, Any, Tuple
 import re
+import sys
+
+
+# One "name: value;" declaration of a Qt widget style (value may contain ':', e.g. url(:/x)).
+# The value is matched greedily up to its last non-space character, so the engine
+# never backtracks through a lazy quantifier. An empty value ("padding:;") still
+# matches, with an empty group 2, so set_widget_props can splice into its span.
+_STYLE_DECL_RE = re.compile(r"([\w-]+)\s*:\s*((?:[^;]*[^;\s])?)\s*(?:;|$)")
+
+# Deletes every hex digit - a "#RRGGBB" tail that translates to "" is all hex
+_HEX_DROP = str.maketrans('', '', '0123456789abcdefABCDEF')
+
+
+def _is_hex6(value) -> bool:
+    """True for a #RRGGBB color string (either case)"""
+    return isinstance(value, str) and len(value) == 7 and value[0] == '#' and not value[1:].translate(_HEX_DROP)
+
+
+# rgb(r, g, b) color function (compiled once - normalize_hex() runs per field)
+_RGB_FUNC_RE = re.compile(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)')
+
+# QSSPalette.from_qss() patterns
+_QSS_HEX_RE = re.compile(r'#[0-9A-Fa-f]{6}\b')
+# /* ... */ comments, unrolled so the engine never backtracks
+_QSS_COMMENT_RE = re.compile(r'/\*[^*]*\*+(?:[^/*][^*]*\*+)*/')
+
+
+def _iter_qss_blocks(qss: str):
+    """
+    Split a stylesheet into its rule blocks in a single forward scan
+
+    Yields:
+        (selectors, properties) per "selectors { declarations }" block, in
+        order - selectors as a tuple of the comma-separated selectors,
+        properties as a name -> value dict (last declaration wins)
+    """
+    if '/*' in qss:
+        qss = _QSS_COMMENT_RE.sub('', qss)
+    pos = 0
+    while True:
+        open_brace = qss.find('{', pos)
+        if open_brace < 0:
+            return
+        close_brace = qss.find('}', open_brace)
+        if close_brace < 0:
+            return
+        selectors = tuple(selector.strip() for selector in qss[pos:open_brace].split(','))
+        yield selectors, {name: value for name, value
+                          in _STYLE_DECL_RE.findall(qss, open_brace + 1, close_brace) if value}
+        pos = close_brace + 1
+
+
+def _block_color(blocks, wanted, prop: str) -> Optional[str]:
+    """First #RRGGBB value of prop in a block with a selector accepted by wanted, uppercased"""
+    for selectors, properties in blocks:
+        value = properties.get(prop)
+        if value and _is_hex6(value[:7]) and any(map(wanted, selectors)):
+            return value[:7].upper()
+    return None
+
+
+def _border_color(blocks) -> Optional[str]:
+    """First #RRGGBB inside any border* declaration (e.g. "1px solid #555555"), uppercased"""
+    for _selectors, properties in blocks:
+        for name, value in properties.items():
+            if name.startswith('border'):
+                color_match = _QSS_HEX_RE.search(value)
+                if color_match:
+                    return color_match.group(0).upper()
+    return None
 
 
 @dataclass
@@ -35,7 +106,7 @@ class TerminalTheme:
 
     def to_dict(self) -> Dict[str, str]:
         """Convert to JSON-serializable dict"""
-        return asdict(self)
+        return {name: getattr(self, name) for name in self._FIELDS}
 
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> 'TerminalTheme':
@@ -47,12 +118,9 @@ class TerminalTheme:
         Validate all colors are valid hex format
         Returns: (is_valid, error_message)
         """
-        hex_pattern = re.compile(r'^#[0-9A-Fa-f]{6}$')
-
-        for field_name, value in asdict(self).items():
-            if field_name == 'name':
-                continue
-            if not hex_pattern.match(value):
+        for field_name in self._COLOR_FIELDS:
+            value = getattr(self, field_name)
+            if not _is_hex6(value):
                 return False, f"Invalid color format for '{field_name}': {value} (expected #RRGGBB)"
 
         return True, ""
@@ -64,18 +132,19 @@ class TerminalTheme:
         Supports: #RGB, #RRGGBB, rgb(r,g,b)
         """
         color = color.strip().upper()
-
-        # Handle #RGB shorthand
-        if re.match(r'^#[0-9A-F]{3}$', color):
+        length = len(color)
+
+        # Dispatch on length - the hex forms are checked with a translate table
+        if (length == 4 or length == 7) and color[0] == '#' and not color[1:].translate(_HEX_DROP):
+            if length == 7:
+                # Handle #RRGGBB
+                return color
+            # Handle #RGB shorthand
             r, g, b = color[1], color[2], color[3]
             return f"#{r}{r}{g}{g}{b}{b}"
 
-        # Handle #RRGGBB
-        if re.match(r'^#[0-9A-F]{6}$', color):
-            return color
-
         # Handle rgb(r, g, b)
-        rgb_match = re.match(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', color.lower())
+        rgb_match = _RGB_FUNC_RE.match(color.lower()) if color.startswith('RGB(') else None
         if rgb_match:
             r, g, b = int(rgb_match.group(1)), int(rgb_match.group(2)), int(rgb_match.group(3))
             return f"#{r:02X}{g:02X}{b:02X}"
@@ -84,323 +153,340 @@ class TerminalTheme:
         return color
 
 
-@dataclass
-class QSSPalette:
-    """QSS color palette (8 core colors)"""
-    background: str = "#FFFFFF"
-    foreground: str = "#000000"
-    primary: str = "#0078D4"
-    secondary: str = "#6C757D"
-    border: str = "#CCCCCC"
-    hover: str = "#E5E5E5"
-    selected: str = "#0078D4"
-    disabled: str = "#999999"
-
-    def to_dict(self) -> Dict[str, str]:
-        """Convert to JSON-serializable dict"""
-        return asdict(self)
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, str]) -> 'QSSPalette':
-        """Create from dict"""
-        return cls(**data)
-
-    def validate(self) -> tuple[bool, str]:
-        """Validate all colors are valid hex format"""
-        hex_pattern = re.compile(r'^#[0-9A-Fa-f]{6}$')
-
-        for field_name, value in asdict(self).items():
-            if not hex_pattern.match(value):
-                return False, f"Invalid color format for '{field_name}': {value}"
+# Field names captured once - asdict() re-walks (and deep-copies) every field per call
+TerminalTheme._FIELDS = tuple(f.name for f in fields(TerminalTheme))
+TerminalTheme._COLOR_FIELDS = tuple(name for name in TerminalTheme._FIELDS if name != 'name')
 
-        return True, ""
 
-    @classmethod
-    def from_qss(cls, qss_code: str) -> 'QSSPalette':
-        """
-        Extract palette from QSS code using regex
-        Attempts to find the most common colors used
-        """
-        # Extract all color values from QSS
-        hex_pattern = re.compile(r'#[0-9A-Fa-f]{6}\b')
-        colors = hex_pattern.findall(qss_code)
-
-        if not colors:
-            return cls()  # Return default palette
-
-        # Count color occurrences
-        from collections import Counter
-        color_counts = Counter(colors)
-        most_common = [color.upper() for color, _ in color_counts.most_common(8)]
-
-        # Try to intelligently assign colors based on common patterns
-        palette = cls()
-
-        # Look for common background patterns
-        bg_match = re.search(r'QWidget\s*\{[^}]*background-color:\s*(#[0-9A-Fa-f]{6})', qss_code)
-        if bg_match:
-            palette.background = bg_match.group(1).upper()
-
-        # Look for common foreground/color patterns
-        fg_match = re.search(r'QWidget\s*\{[^}]*color:\s*(#[0-9A-Fa-f]{6})', qss_code)
-        if fg_match:
-            palette.foreground = fg_match.group(1).upper()
-
-        # Look for button primary color
-        btn_match = re.search(r'QPushButton\s*\{[^}]*background-color:\s*(#[0-9A-Fa-f]{6})', qss_code)
-        if btn_match:
-            palette.primary = btn_match.group(1).upper()
-
-        # Look for hover color
-        hover_match = re.search(r':hover\s*\{[^}]*background-color:\s*(#[0-9A-Fa-f]{6})', qss_code)
-        if hover_match:
-            palette.hover = hover_match.group(1).upper()
-
-        # Look for selection color
-        sel_match = re.search(r'::item:selected\s*\{[^}]*background-color:\s*(#[0-9A-Fa-f]{6})', qss_code)
-        if sel_match:
-            palette.selected = sel_match.group(1).upper()
-
-        # Look for border color
-        border_match = re.search(r'border.*:\s*(#[0-9A-Fa-f]{6})', qss_code)
-        if border_match:
-            palette.border = border_match.group(1).upper()
-
-        return palette
-
-    def generate_qss(self, template: str = 'default') -> str:
-        """
-        Generate QSS code from palette
-        Templates: 'default', 'material', 'flat', 'classic'
-        """
-        if template == 'material':
-            return self._generate_material_qss()
-        elif template == 'flat':
-            return self._generate_flat_qss()
-        elif template == 'classic':
-            return self._generate_classic_qss()
-        else:
-            return self._generate_default_qss()
-
-    def _generate_default_qss(self) -> str:
-        """Generate default QSS stylesheet"""
-        return f"""/* Theme Editor - Generated QSS Theme */
+# Default QSSPalette stylesheet; filled with %-formatting from the palette colors,
+# parsed once here rather than evaluated as a ~40-field f-string per call
+_DEFAULT_QSS_TEMPLATE = """/* Theme Editor - Generated QSS Theme */
 
 /* Main Window and Widgets */
-QWidget {{
-    background-color: {self.background};
-    color: {self.foreground};
+QWidget {
+    background-color: %(background)s;
+    color: %(foreground)s;
     font-size: 10pt;
-}}
+}
 
 /* Buttons */
-QPushButton {{
-    background-color: {self.primary};
-    color: {self.background};
-    border: 1px solid {self.border};
+QPushButton {
+    background-color: %(primary)s;
+    color: %(background)s;
+    border: 1px solid %(border)s;
     border-radius: 4px;
     padding: 5px 15px;
     min-width: 80px;
-}}
+}
 
-QPushButton:hover {{
-    background-color: {self.hover};
-    color: {self.foreground};
-}}
+QPushButton:hover {
+    background-color: %(hover)s;
+    color: %(foreground)s;
+}
 
-QPushButton:pressed {{
-    background-color: {self.selected};
-    color: {self.background};
-}}
+QPushButton:pressed {
+    background-color: %(selected)s;
+    color: %(background)s;
+}
 
-QPushButton:disabled {{
-    background-color: {self.disabled};
-    color: {self.border};
-}}
+QPushButton:disabled {
+    background-color: %(disabled)s;
+    color: %(border)s;
+}
 
 /* Input Fields */
-QLineEdit, QTextEdit, QPlainTextEdit {{
-    background-color: {self.background};
-    color: {self.foreground};
-    border: 1px solid {self.border};
+QLineEdit, QTextEdit, QPlainTextEdit {
+    background-color: %(background)s;
+    color: %(foreground)s;
+    border: 1px solid %(border)s;
     border-radius: 3px;
     padding: 4px;
-}}
+}
 
-QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
-    border: 2px solid {self.primary};
-}}
+QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
+    border: 2px solid %(primary)s;
+}
 
 /* ComboBox */
-QComboBox {{
-    background-color: {self.background};
-    color: {self.foreground};
-    border: 1px solid {self.border};
+QComboBox {
+    background-color: %(background)s;
+    color: %(foreground)s;
+    border: 1px solid %(border)s;
     border-radius: 3px;
     padding: 4px;
-}}
+}
 
-QComboBox:hover {{
-    border: 1px solid {self.primary};
-}}
+QComboBox:hover {
+    border: 1px solid %(primary)s;
+}
 
-QComboBox::drop-down {{
+QComboBox::drop-down {
     border: none;
-}}
+}
 
-QComboBox QAbstractItemView {{
-    background-color: {self.background};
-    color: {self.foreground};
-    selection-background-color: {self.selected};
-    selection-color: {self.background};
-}}
+QComboBox QAbstractItemView {
+    background-color: %(background)s;
+    color: %(foreground)s;
+    selection-background-color: %(selected)s;
+    selection-color: %(background)s;
+}
 
 /* SpinBox */
-QSpinBox, QDoubleSpinBox {{
-    background-color: {self.background};
-    color: {self.foreground};
-    border: 1px solid {self.border};
+QSpinBox, QDoubleSpinBox {
+    background-color: %(background)s;
+    color: %(foreground)s;
+    border: 1px solid %(border)s;
     border-radius: 3px;
     padding: 3px;
-}}
+}
 
 /* CheckBox and RadioButton */
-QCheckBox, QRadioButton {{
-    color: {self.foreground};
+QCheckBox, QRadioButton {
+    color: %(foreground)s;
     spacing: 5px;
-}}
+}
 
-QCheckBox::indicator, QRadioButton::indicator {{
+QCheckBox::indicator, QRadioButton::indicator {
     width: 16px;
     height: 16px;
-    border: 1px solid {self.border};
-    background-color: {self.background};
-}}
+    border: 1px solid %(border)s;
+    background-color: %(background)s;
+}
 
-QCheckBox::indicator:checked, QRadioButton::indicator:checked {{
-    background-color: {self.primary};
-}}
+QCheckBox::indicator:checked, QRadioButton::indicator:checked {
+    background-color: %(primary)s;
+}
 
 /* ProgressBar */
-QProgressBar {{
-    background-color: {self.background};
-    border: 1px solid {self.border};
+QProgressBar {
+    background-color: %(background)s;
+    border: 1px solid %(border)s;
     border-radius: 3px;
     text-align: center;
-}}
+}
 
-QProgressBar::chunk {{
-    background-color: {self.primary};
+QProgressBar::chunk {
+    background-color: %(primary)s;
     border-radius: 2px;
-}}
+}
 
 /* Slider */
-QSlider::groove:horizontal {{
-    background: {self.border};
+QSlider::groove:horizontal {
+    background: %(border)s;
     height: 6px;
     border-radius: 3px;
-}}
+}
 
-QSlider::handle:horizontal {{
-    background: {self.primary};
+QSlider::handle:horizontal {
+    background: %(primary)s;
     width: 16px;
     margin: -5px 0;
     border-radius: 8px;
-}}
+}
 
 /* List, Tree, Table */
-QListWidget, QTreeWidget, QTableWidget {{
-    background-color: {self.background};
-    color: {self.foreground};
-    border: 1px solid {self.border};
-    alternate-background-color: {self.hover};
-}}
-
-QListWidget::item:selected, QTreeWidget::item:selected, QTableWidget::item:selected {{
-    background-color: {self.selected};
-    color: {self.background};
-}}
+QListWidget, QTreeWidget, QTableWidget {
+    background-color: %(background)s;
+    color: %(foreground)s;
+    border: 1px solid %(border)s;
+    alternate-background-color: %(hover)s;
+}
+
+QListWidget::item:selected, QTreeWidget::item:selected, QTableWidget::item:selected {
+    background-color: %(selected)s;
+    color: %(background)s;
+}
 
 /* TabWidget */
-QTabWidget::pane {{
-    border: 1px solid {self.border};
-    background-color: {self.background};
-}}
-
-QTabBar::tab {{
-    background-color: {self.hover};
-    color: {self.foreground};
-    border: 1px solid {self.border};
+QTabWidget::pane {
+    border: 1px solid %(border)s;
+    background-color: %(background)s;
+}
+
+QTabBar::tab {
+    background-color: %(hover)s;
+    color: %(foreground)s;
+    border: 1px solid %(border)s;
     padding: 6px 12px;
-}}
+}
 
-QTabBar::tab:selected {{
-    background-color: {self.primary};
-    color: {self.background};
-}}
+QTabBar::tab:selected {
+    background-color: %(primary)s;
+    color: %(background)s;
+}
 
 /* GroupBox */
-QGroupBox {{
-    border: 1px solid {self.border};
+QGroupBox {
+    border: 1px solid %(border)s;
     border-radius: 4px;
     margin-top: 10px;
     padding-top: 10px;
-    color: {self.foreground};
-}}
+    color: %(foreground)s;
+}
 
-QGroupBox::title {{
+QGroupBox::title {
     subcontrol-origin: margin;
     subcontrol-position: top left;
     padding: 0 5px;
-    color: {self.foreground};
-}}
+    color: %(foreground)s;
+}
 
 /* MenuBar and Menu */
-QMenuBar {{
-    background-color: {self.background};
-    color: {self.foreground};
-}}
-
-QMenuBar::item:selected {{
-    background-color: {self.hover};
-}}
-
-QMenu {{
-    background-color: {self.background};
-    color: {self.foreground};
-    border: 1px solid {self.border};
-}}
-
-QMenu::item:selected {{
-    background-color: {self.selected};
-    color: {self.background};
-}}
+QMenuBar {
+    background-color: %(background)s;
+    color: %(foreground)s;
+}
+
+QMenuBar::item:selected {
+    background-color: %(hover)s;
+}
+
+QMenu {
+    background-color: %(background)s;
+    color: %(foreground)s;
+    border: 1px solid %(border)s;
+}
+
+QMenu::item:selected {
+    background-color: %(selected)s;
+    color: %(background)s;
+}
 
 /* StatusBar */
-QStatusBar {{
-    background-color: {self.background};
-    color: {self.foreground};
-    border-top: 1px solid {self.border};
-}}
+QStatusBar {
+    background-color: %(background)s;
+    color: %(foreground)s;
+    border-top: 1px solid %(border)s;
+}
 
 /* ScrollBar */
-QScrollBar:vertical {{
-    background: {self.background};
+QScrollBar:vertical {
+    background: %(background)s;
     width: 12px;
-    border: 1px solid {self.border};
-}}
+    border: 1px solid %(border)s;
+}
 
-QScrollBar::handle:vertical {{
-    background: {self.primary};
+QScrollBar::handle:vertical {
+    background: %(primary)s;
     min-height: 20px;
     border-radius: 4px;
-}}
+}
 
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
     height: 0px;
-}}
+}
 """
 
+
+@functools.lru_cache(maxsize=32)
+def _build_default_qss(background: str, foreground: str, primary: str, secondary: str,
+                       border: str, hover: str, selected: str, disabled: str) -> str:
+    """Fill _DEFAULT_QSS_TEMPLATE for one set of palette colors.
+    Memoized - live previews regenerate the same palette far more often than it changes."""
+    return _DEFAULT_QSS_TEMPLATE % {
+        'background': background,
+        'foreground': foreground,
+        'primary': primary,
+        'secondary': secondary,
+        'border': border,
+        'hover': hover,
+        'selected': selected,
+        'disabled': disabled,
+    }
+
+
+@dataclass
+class QSSPalette:
+    """QSS color palette (8 core colors)"""
+    background: str = "#FFFFFF"
+    foreground: str = "#000000"
+    primary: str = "#0078D4"
+    secondary: str = "#6C757D"
+    border: str = "#CCCCCC"
+    hover: str = "#E5E5E5"
+    selected: str = "#0078D4"
+    disabled: str = "#999999"
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to JSON-serializable dict"""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> 'QSSPalette':
+        """Create from dict"""
+        return cls(**data)
+
+    def validate(self) -> tuple[bool, str]:
+        """Validate all colors are valid hex format"""
+        for field_name in self._FIELDS:
+            value = getattr(self, field_name)
+            if not _is_hex6(value):
+                return False, f"Invalid color format for '{field_name}': {value}"
+
+        return True, ""
+
+    @classmethod
+    def from_qss(cls, qss_code: str) -> 'QSSPalette':
+        """
+        Extract palette from QSS code
+        Reads the colors of well-known rules (QWidget, QPushButton, :hover, ...)
+        from one tokenizing pass over the stylesheet
+        """
+        if '#' not in qss_code or '{' not in qss_code or not _QSS_HEX_RE.search(qss_code):
+            return cls()  # No colored rules at all - return default palette
+
+        blocks = list(_iter_qss_blocks(qss_code))
+
+        # Try to intelligently assign colors based on common patterns
+        palette = cls()
+
+        # Each lookup walks the blocks - skip it outright when its selector or
+        # property never appears in the text (a C-level substring scan)
+
+        # Look for common background / foreground patterns
+        if 'QWidget' in qss_code:
+            palette.background = _block_color(blocks, 'QWidget'.__eq__, 'background-color') or palette.background
+            palette.foreground = _block_color(blocks, 'QWidget'.__eq__, 'color') or palette.foreground
+
+        # Look for button primary color
+        if 'QPushButton' in qss_code:
+            palette.primary = _block_color(blocks, 'QPushButton'.__eq__, 'background-color') or palette.primary
+
+        # Look for hover color
+        if ':hover' in qss_code:
+            palette.hover = _block_color(
+                blocks, lambda selector: selector.endswith(':hover'), 'background-color') or palette.hover
+
+        # Look for selection color
+        if '::item:selected' in qss_code:
+            palette.selected = _block_color(
+                blocks, lambda selector: selector.endswith('::item:selected'), 'background-color') or palette.selected
+
+        # Look for border color
+        if 'border' in qss_code:
+            palette.border = _border_color(blocks) or palette.border
+
+        return palette
+
+    def generate_qss(self, template: str = 'default') -> str:
+        """
+        Generate QSS code from palette
+        Templates: 'default', 'material', 'flat', 'classic'
+        """
+        if template == 'material':
+            return self._generate_material_qss()
+        elif template == 'flat':
+            return self._generate_flat_qss()
+        elif template == 'classic':
+            return self._generate_classic_qss()
+        else:
+            return self._generate_default_qss()
+
+    def _generate_default_qss(self) -> str:
+        """Generate default QSS stylesheet"""
+        return _build_default_qss(self.background, self.foreground, self.primary, self.secondary,
+                                  self.border, self.hover, self.selected, self.disabled)
+
     def _generate_material_qss(self) -> str:
         """Generate Material Design style QSS"""
         # Simplified - full implementation would be more extensive
@@ -415,6 +501,10 @@ QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
         return self._generate_default_qss()
 
 
+# Field names captured once, as for TerminalTheme
+QSSPalette._FIELDS = tuple(f.name for f in fields(QSSPalette))
+
+
 @dataclass
 class CustomTkinterTheme:
     """CustomTkinter theme structure with light/dark mode support"""
@@ -500,6 +590,18 @@ class QtWidgetTheme:
     """Qt Widget theme structure with widget-specific styles"""
     name: str
     styles: Dict[str, str] = field(default_factory=dict)
+    # (selector, style) -> formatted stylesheet block, reused across generate_stylesheet() calls
+    _block_cache: Dict[Tuple[str, str], str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # selector -> (style string, its parsed properties); kept in step by the style setters
+    _props_cache: Dict[str, Tuple[str, Dict[str, str]]] = field(default_factory=dict, init=False, repr=False,
+                                                                compare=False)
+    # Bumped by every style setter, so callers can cache derived output per version
+    _styles_version: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def styles_version(self) -> int:
+        """Counter that changes whenever a widget style is added, changed or removed"""
+        return self._styles_version
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to JSON-serializable dict"""
@@ -528,7 +630,12 @@ class QtWidgetTheme:
             selector: Qt selector (e.g., "QPushButton", "QPushButton:hover")
             style: CSS-like style string
         """
+        old_style = self.styles.get(selector)
+        if old_style is not None:
+            self._block_cache.pop((selector, old_style), None)
+            self._props_cache.pop(selector, None)
         self.styles[selector] = style
+        self._styles_version += 1
 
     def remove_widget_style(self, selector: str):
         """
@@ -538,7 +645,10 @@ class QtWidgetTheme:
             selector: Qt selector to remove
         """
         if selector in self.styles:
+            self._block_cache.pop((selector, self.styles[selector]), None)
+            self._props_cache.pop(selector, None)
             del self.styles[selector]
+            self._styles_version += 1
 
     def get_widget_style(self, selector: str) -> Optional[str]:
         """
@@ -552,6 +662,135 @@ class QtWidgetTheme:
         """
         return self.styles.get(selector)
 
+    @staticmethod
+    def parse_style(style: str) -> Dict[str, str]:
+        """
+        Parse a CSS-like style string into an ordered property dict
+
+        Args:
+            style: Style string (e.g., "color: #FFFFFF; padding: 4px")
+
+        Returns:
+            Dict of property name -> value, in declaration order
+        """
+        if not style:
+            return {}
+        if ';' not in style:
+            # Single declaration (the common case while typing) - split it
+            # directly. Only plain [\w-]+ names with a value take this path;
+            # anything else goes through the regex below.
+            name, sep, value = style.partition(':')
+            name = name.strip()
+            value = value.strip()
+            if sep and value and name.replace('-', '').replace('_', '').isalnum():
+                return {sys.intern(name): value}
+        # Property names recur across every widget style - intern them so
+        # dict lookups on them hit the identity fast path. Blank declarations
+        # ("padding:;") are dropped.
+        return {sys.intern(name): value for name, value in _STYLE_DECL_RE.findall(style) if value}
+
+    def get_widget_props(self, selector: str) -> Dict[str, str]:
+        """
+        Get the parsed properties of a widget style
+
+        The style is parsed once and reused until it changes. The returned
+        dict is shared - update it through set_widget_props().
+
+        Args:
+            selector: Qt selector
+
+        Returns:
+            Dict of property name -> value (empty if the selector has no style)
+        """
+        style = self.styles.get(selector) or ""
+        cached = self._props_cache.get(selector)
+        if cached is None or cached[0] != style:
+            cached = (style, self.parse_style(style))
+            self._props_cache[selector] = cached
+        return cached[1]
+
+    def set_widget_props(self, selector: str, updates: Dict[str, str]) -> str:
+        """
+        Set one or more properties of a widget style
+
+        Existing values are spliced into the stored style string in place,
+        so the rest of it (including the user's formatting) is untouched;
+        new properties are appended. A blank value empties the property's
+        value spans but keeps its declaration ("color: ;"), so a value typed
+        afterwards lands back in the same place. The parsed properties are
+        updated alongside (blank properties are dropped, as in parse_style()),
+        re-parsing only when a value carries its own ';'-separated declarations
+        or refills a cleared one.
+
+        Args:
+            selector: Qt selector
+            updates: Property name -> new value
+
+        Returns:
+            The new style string
+
+        Example:
+            Clearing a value and typing a new one edits the declaration in place:
+
+            >>> theme = QtWidgetTheme(name="T", styles={"A": "color: #111; padding: 4px; margin: 2px"})
+            >>> theme.set_widget_props("A", {"color": ""})
+            'color: ; padding: 4px; margin: 2px'
+            >>> theme.get_widget_props("A")
+            {'padding': '4px', 'margin': '2px'}
+            >>> theme.set_widget_props("A", {"color": "#222"})
+            'color: #222; padding: 4px; margin: 2px'
+            >>> _ = theme.set_widget_props("A", {"margin": ""})
+            >>> theme.set_widget_props("A", {"margin": "8px"})
+            'color: #222; padding: 4px; margin: 8px'
+        """
+        style = self.styles.get(selector) or ""
+        properties = self.get_widget_props(selector)
+        updates = {name: value.strip() for name, value in updates.items()}
+
+        # (start, end, replacement) edits: the value span of each set property
+        # (the last declaration wins, as in parse_style()) and every value span
+        # of each cleared one
+        edits = []
+        spans = {}
+        for match in _STYLE_DECL_RE.finditer(style):
+            name = match.group(1)
+            value = updates.get(name)
+            if value is None:
+                continue
+            start, end = match.span(2)
+            if not value:
+                edits.append((start, end, ""))
+            # "padding:;" - keep the usual space after the colon
+            spans[name] = (start, end, " " + value if value and style[start - 1] == ':' else value)
+        edits.extend(span for span in spans.values() if span[2])
+
+        # Splice from the end so earlier offsets stay valid
+        for start, end, text in sorted(edits, reverse=True):
+            style = style[:start] + text + style[end:]
+
+        added = [(name, value) for name, value in updates.items() if value and name not in spans]
+        if added:
+            base = style.rstrip()
+            separator = "" if not base else (" " if base.endswith(";") else "; ")
+            style = base + separator + "; ".join(map(": ".join, added))
+
+        # A value with its own declarations, or one refilling a cleared
+        # declaration (which must keep its place in the dict order), re-parses
+        if any(';' in value or (value and name in spans and name not in properties)
+               for name, value in updates.items()):
+            properties = self.parse_style(style)
+        else:
+            properties = dict(properties)
+            for name, value in updates.items():
+                if value:
+                    properties[name] = value
+                else:
+                    properties.pop(name, None)
+
+        self.add_widget_style(selector, style)
+        self._props_cache[selector] = (style, properties)
+        return style
+
     def generate_stylesheet(self) -> str:
         """
         Generate complete Qt stylesheet from widget styles
@@ -559,11 +798,20 @@ class QtWidgetTheme:
         Returns:
             Qt stylesheet string
         """
-        stylesheet_parts = []
+        stylesheet_parts: List[str] = []
+        block_cache = self._block_cache
 
         for selector, style in sorted(self.styles.items()):
-            # Format: "Selector { style }"
-            stylesheet_parts.append(f"{selector} {{\n    {style}\n}}")
+            # Empty rules change nothing - keep them out of Qt's CSS parser
+            if not style or style.isspace():
+                continue
+
+            # Format: "Selector { style }" - unchanged selectors are cache hits
+            block = block_cache.get((selector, style))
+            if block is None:
+                block = f"{selector} {{\n    {style}\n}}"
+                block_cache[(selector, style)] = block
+            stylesheet_parts.append(block)
 
         return "\n\n".join(stylesheet_parts)
 
@@ -11,6 +11,49 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from .theme_data import TerminalTheme, QSSPalette, CustomTkinterTheme, QtWidgetTheme
 
+try:
+    import orjson
+except ImportError:  # optional speed-up - stdlib json produces identical output
+    orjson = None
+
+
+def encode_json(data) -> bytes:
+    """Encode data as UTF-8 JSON bytes, with orjson when it is installed
+
+    Both backends emit the same text: 2-space indent, with non-ASCII
+    characters written as-is.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json_object(f, items):
+    """Write (key, value) pairs to binary file f as one JSON object, entry by entry
+
+    Produces the same bytes as encode_json(dict(items)) without ever
+    holding the whole document in memory. Encoded JSON never contains a raw
+    newline inside a string, so nested indentation can be shifted by
+    rewriting newlines.
+    """
+    empty = True
+    for key, value in items:
+        f.write(b"{\n" if empty else b",\n")
+        empty = False
+        f.write(b"  " + encode_json(key) + b": " + encode_json(value).replace(b"\n", b"\n  "))
+    f.write(b"{}" if empty else b"\n}")
+
+
+def decode_json(data: bytes):
+    """Decode UTF-8 JSON bytes, with orjson when it is installed
+
+    Malformed input raises json.JSONDecodeError for either backend
+    (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ThemeManager:
     """Central theme management for all supported formats"""
@@ -478,8 +521,8 @@ class ThemeManager:
             return {}
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = decode_json(f.read())
 
             themes = {}
             for theme_name, theme_data in data.items():
@@ -513,13 +556,11 @@ class ThemeManager:
         if backup and filepath.exists():
             self._create_backup(filepath)
 
-        # Convert themes to dict
-        themes_dict = {name: theme.to_dict() for name, theme in themes.items()}
-
-        # Save to file
+        # Save to file - one encoded theme at a time, so the whole document is
+        # never materialised at once (and json.dump()'s per-token writes are avoided)
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(themes_dict, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                write_json_object(f, ((name, theme.to_dict()) for name, theme in themes.items()))
         except Exception as e:
             print(f"Error saving Qt widget themes to {filepath}: {e}")
             # Attempt to restore from backup